@@ -34,6 +34,7 @@ class CommitsOrCloutStack(Stack):
             removal_policy=RemovalPolicy.DESTROY,  # Keep as DESTROY to avoid deployment issues
             auto_delete_objects=True,  # Keep as True to avoid permission errors
             website_index_document="index.html",
+            versioned=True,  # Previous index.html / historical_data.json versions are kept for rollback
             public_read_access=True,  # Allow public access to read the website
             block_public_access=s3.BlockPublicAccess(
                 block_public_acls=False,
@@ -99,6 +100,21 @@ class CommitsOrCloutStack(Stack):
             default_root_object="index.html",
         )
 
+        # Deploy the static stylesheet and chart script; the Lambda-rendered page only inlines its data.
+        # The file names are not fingerprinted, so keep the browser cache short and invalidate them on deploy
+        s3deploy.BucketDeployment(
+            self,
+            "DeployStaticAssets",
+            sources=[s3deploy.Source.asset("../lambda_function/static")],
+            destination_bucket=website_bucket,
+            destination_key_prefix="",
+            cache_control=[s3deploy.CacheControl.max_age(Duration.days(1))],
+            distribution=distribution,
+            distribution_paths=["/styles.css", "/chart-init.js"],
+            retain_on_delete=True,
+            prune=False
+        )
+
         # Output the CloudFront domain name and distribution ID
         CfnOutput(self, "CloudFrontDomainName", 
                   value=distribution.distribution_domain_name,
@@ -179,6 +195,17 @@ class CommitsOrCloutStack(Stack):
         
         # Grant the Lambda function permission to write to the S3 bucket
         website_bucket.grant_write(lambda_function)
+
+        # Grant the Lambda function permission to restore previous object versions
+        lambda_function.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=["s3:ListBucketVersions", "s3:GetObjectVersion"],
+                resources=[
+                    website_bucket.bucket_arn,
+                    website_bucket.arn_for_objects("*"),
+                ]
+            )
+        )
         
         # Create a CloudWatch Event Rule to schedule the Lambda
         rule = events.Rule(
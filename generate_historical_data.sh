@@ -96,6 +96,17 @@ if [ -n "$GITHUB_ORGANIZATION" ]; then
     print_status "GitHub Organization: $GITHUB_ORGANIZATION"
 fi
 
+# Snapshot the current history before the backfill overwrites it. Noncurrent versions
+# expire after a day, so this timestamped copy is what a bad backfill can be rolled back from
+backup_filename="historical_data_backup_$(date +%Y%m%d_%H%M%S).json"
+aws s3 cp "s3://$S3_BUCKET/historical_data.json" "s3://$S3_BUCKET/$backup_filename"
+
+if [ $? -eq 0 ]; then
+    print_success "Backup created: s3://$S3_BUCKET/$backup_filename"
+else
+    print_warning "Failed to create backup file"
+fi
+
 # Generate historical data
 print_status "Generating historical data..."
 python src/generate_historical_data.py
@@ -117,39 +128,8 @@ fi
 file_size=$(du -h historical_data.json | cut -f1)
 print_status "Generated file size: $file_size"
 
-# Upload to S3
-print_status "Uploading historical data to S3..."
-
-# Upload main file
-aws s3 cp historical_data.json "s3://$S3_BUCKET/historical_data.json" --content-type "application/json"
-
-if [ $? -eq 0 ]; then
-    print_success "Historical data uploaded to S3: s3://$S3_BUCKET/historical_data.json"
-else
-    print_error "Failed to upload historical data to S3"
-    exit 1
-fi
-
-# Create backup
-backup_filename="historical_data_backup_$(date +%Y%m%d_%H%M%S).json"
-aws s3 cp historical_data.json "s3://$S3_BUCKET/$backup_filename" --content-type "application/json"
-
-if [ $? -eq 0 ]; then
-    print_success "Backup created: s3://$S3_BUCKET/$backup_filename"
-else
-    print_warning "Failed to create backup file"
-fi
-
-# Also upload as the standard backup filename
-aws s3 cp historical_data.json "s3://$S3_BUCKET/historical_data_backup.json" --content-type "application/json"
-
-if [ $? -eq 0 ]; then
-    print_success "Standard backup updated: s3://$S3_BUCKET/historical_data_backup.json"
-else
-    print_warning "Failed to update standard backup file"
-fi
-
-# Verify upload
+# generate_historical_data.py has already uploaded the history, gzip-encoded; the local
+# file is an indented copy for reference and is not uploaded over it
 print_status "Verifying S3 upload..."
 aws s3 ls "s3://$S3_BUCKET/historical_data.json" > /dev/null 2>&1
 
@@ -165,10 +145,9 @@ print_status "Cleaning up..."
 deactivate
 
 print_success "Historical data generation and upload completed successfully!"
-print_status "Files uploaded:"
+print_status "Uploaded by generate_historical_data.py (gzip-encoded):"
 print_status "  - s3://$S3_BUCKET/historical_data.json"
-print_status "  - s3://$S3_BUCKET/historical_data_backup.json"
-print_status "  - s3://$S3_BUCKET/$backup_filename"
+print_status "Previous history backed up to s3://$S3_BUCKET/$backup_filename"
 
 echo ""
 print_status "You can now trigger your Lambda function to use the updated historical data."
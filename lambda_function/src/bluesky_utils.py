@@ -1,9 +1,8 @@
 from atproto import Client
 import logging
 
-# Configure logging
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# Level and handlers come from the entrypoint (the Lambda handler or a local script)
+logger = logging.getLogger(__name__)
 
 class BlueskyHelper:
     def __init__(self, api_key):
@@ -0,0 +1,56 @@
+"""
+Fake historical data for rendering the Commits or Clout page locally
+"""
+from datetime import date, datetime
+from utils import calculate_ratio_tenths
+
+# Every fake entry is stamped at noon Pacific on its date
+LAST_UPDATED_TIME = "T12:00:00-08:00"
+
+def generate_fake_historical_data(days=28):
+    """
+    Generate fake historical data for the past 4 weeks
+    
+    Args:
+        days (int): Number of days of historical data to generate
+        
+    Returns:
+        dict: Dictionary containing fake historical data
+    """
+    today_ordinal = datetime.now().date().toordinal()
+    
+    # Start with base values
+    base_commits = 200
+    base_followers = 80
+    base_youtube_subscribers = 12  
+    base_bluesky_followers = 10
+
+    # Build each field as its own column, indexed by days since the first entry
+    offsets = range(days)
+    dates = [date.fromordinal(today_ordinal - days + n).isoformat() for n in offsets]
+    commits = [base_commits + (n * 2) + ((n % 7) * 5) for n in offsets]  # Increasing trend with weekly pattern
+    followers = [base_followers + (n // 2) for n in offsets]  # Slower increasing trend
+    youtube_subscribers = [base_youtube_subscribers + n for n in offsets]  # Steady growth for YouTube
+    bluesky_followers = [base_bluesky_followers + (n * 2) for n in offsets]  # Steady growth for Bluesky
+
+    # Calculate total followers and the ratio based on them
+    total_followers = [t + y + b for t, y, b in zip(followers, youtube_subscribers, bluesky_followers)]
+    ratios = [calculate_ratio_tenths(c, t) / 10 for c, t in zip(commits, total_followers)]
+
+    # Assemble the entries only at the end, in the shape the template expects
+    data = [
+        {
+            "date": date_str,
+            "github_commits": day_commits,
+            "twitter_followers": day_followers,
+            "youtube_subscribers": day_youtube_subscribers,
+            "bluesky_followers": day_bluesky_followers,
+            "total_followers": day_total_followers,
+            "ratio": ratio,
+            "last_updated": date_str + LAST_UPDATED_TIME
+        }
+        for date_str, day_commits, day_followers, day_youtube_subscribers, day_bluesky_followers, day_total_followers, ratio
+        in zip(dates, commits, followers, youtube_subscribers, bluesky_followers, total_followers, ratios)
+    ]
+    
+    return {"data": data}
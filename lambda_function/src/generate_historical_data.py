@@ -1,13 +1,15 @@
+import gzip
 import os
-import json
+import orjson
 import logging
 import requests
 import boto3
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from youtube_utils import get_youtube_subscriber_count
 from bluesky_utils import BlueskyHelper
+from utils import load_json_body, calculate_ratio_tenths, get_latest_version_id, boto_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -33,14 +35,14 @@ BLUESKY_USERNAME = os.getenv("BLUESKY_USERNAME")
 # S3 configuration
 S3_BUCKET = os.getenv("S3_BUCKET")
 S3_HISTORY_KEY = os.getenv("S3_HISTORY_KEY", "historical_data.json")
-S3_HISTORY_BACKUP_KEY = os.getenv("S3_HISTORY_BACKUP_KEY", "historical_data_backup.json")
 
 # Constants
 TWITTER_FOLLOWERS = 35  # Fixed number of Twitter followers
 OUTPUT_FILE = "historical_data.json"
+PACIFIC_TZ = ZoneInfo('America/Los_Angeles')
 
 # Initialize S3 client
-s3 = boto3.client('s3')
+s3 = boto3.client('s3', config=boto_config)
 
 def get_user_repositories(username, token):
     """
@@ -66,7 +68,7 @@ def get_user_repositories(username, token):
             logger.info(f"API Response Status: {response.status_code}")
 
             response.raise_for_status()
-            repos = response.json()
+            repos = orjson.loads(response.content)
 
             if not repos:  # No more repositories
                 break
@@ -116,7 +118,7 @@ def get_organization_repositories(organization, token):
             logger.info(f"Organization API Response Status: {response.status_code}")
 
             response.raise_for_status()
-            repos = response.json()
+            repos = orjson.loads(response.content)
 
             if not repos:  # No more repositories
                 break
@@ -222,7 +224,7 @@ def get_daily_commits(username, token, start_date, end_date):
                 branches_params["page"] = branches_page
                 branches_response = requests.get(branches_url, headers=repo_headers, params=branches_params)
                 branches_response.raise_for_status()
-                page_branches = branches_response.json()
+                page_branches = orjson.loads(branches_response.content)
 
                 if not page_branches:
                     break
@@ -271,7 +273,7 @@ def get_daily_commits(username, token, start_date, end_date):
                             logger.warning(f"Skipping branch {branch_name} in repo {repo_name}: {commits_response.status_code}")
                             break
 
-                        commits = commits_response.json()
+                        commits = orjson.loads(commits_response.content)
                         if not commits:
                             break
 
@@ -326,23 +328,23 @@ def get_historical_data_from_s3():
     try:
         logger.info(f"Fetching historical data from S3: {S3_BUCKET}/{S3_HISTORY_KEY}")
         response = s3.get_object(Bucket=S3_BUCKET, Key=S3_HISTORY_KEY)
-        historical_data = json.loads(response['Body'].read().decode('utf-8'))
+        historical_data = load_json_body(response)
         logger.info(f"Successfully retrieved historical data from S3")
         return historical_data
     except s3.exceptions.NoSuchKey:
-        logger.info(f"No historical data found in S3, trying to restore from backup")
-        logger.info(f"Fetching backup historical data from S3: {S3_BUCKET}/{S3_HISTORY_BACKUP_KEY}")
+        logger.info(f"No historical data found in S3, trying to restore from a previous version")
         try:
-            # Try to restore from backup
-            response = s3.get_object(Bucket=S3_BUCKET, Key=S3_HISTORY_BACKUP_KEY)
-            historical_data = json.loads(response['Body'].read().decode('utf-8'))
-            logger.info(f"Successfully restored historical data from backup")
+            # Try to restore from the most recent noncurrent version
+            version_id = get_latest_version_id(s3, S3_BUCKET, S3_HISTORY_KEY)
+            if version_id is None:
+                logger.info(f"No previous version of historical data found either")
+                raise Exception("No historical data found in S3")
+            response = s3.get_object(Bucket=S3_BUCKET, Key=S3_HISTORY_KEY, VersionId=version_id)
+            historical_data = load_json_body(response)
+            logger.info(f"Successfully restored historical data from version {version_id}")
             return historical_data
-        except s3.exceptions.NoSuchKey:
-            logger.info(f"No backup historical data found either, creating new dataset")
-            raise Exception("No historical data found in S3")
         except Exception as e:
-            logger.error(f"Error restoring from backup: {e}")
+            logger.error(f"Error restoring from previous version: {e}")
             raise e;
     except Exception as e:
         logger.error(f"Error retrieving historical data from S3: {e}")
@@ -353,36 +355,19 @@ def save_historical_data_to_s3(historical_data):
     Save historical data to S3 bucket
     """
     try:
-        # First, create a backup of the existing data
-        try:
-            # Check if the file exists before trying to copy it
-            s3.head_object(Bucket=S3_BUCKET, Key=S3_HISTORY_KEY)
-
-            # Copy the existing file to a backup
-            s3.copy_object(
-                Bucket=S3_BUCKET,
-                CopySource={'Bucket': S3_BUCKET, 'Key': S3_HISTORY_KEY},
-                Key=S3_HISTORY_BACKUP_KEY
-            )
-            logger.info(f"Created backup of historical data at s3://{S3_BUCKET}/{S3_HISTORY_BACKUP_KEY}")
-        except s3.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                logger.info(f"No existing historical data file to backup")
-            else:
-                logger.warning(f"Error creating backup of historical data: {e}")
-
-        # Now save the new data
+        # The bucket is versioned, so the previous object is kept as a noncurrent version
         s3.put_object(
             Bucket=S3_BUCKET,
             Key=S3_HISTORY_KEY,
-            Body=json.dumps(historical_data, indent=2).encode('utf-8'),
-            ContentType='application/json'
+            Body=gzip.compress(orjson.dumps(historical_data), compresslevel=6),
+            ContentType='application/json',
+            ContentEncoding='gzip'
         )
         logger.info(f"Successfully saved historical data to S3")
 
         # Also save locally for reference
-        with open(OUTPUT_FILE, 'w') as f:
-            json.dump(historical_data, indent=2, fp=f)
+        with open(OUTPUT_FILE, 'wb') as f:
+            f.write(orjson.dumps(historical_data, option=orjson.OPT_INDENT_2))
         logger.info(f"Historical data saved locally to {OUTPUT_FILE}")
 
         return True
@@ -394,17 +379,17 @@ def generate_historical_data():
     """
     Generate historical data from January 1st to today with cumulative commit counts.
     Uses existing data from S3 as the source of truth and updates it.
+    Returns the updated data, or None if saving it to S3 failed.
     """
     # Use Pacific timezone for all date operations
-    pacific_tz = pytz.timezone('America/Los_Angeles')
-    current_year = datetime.now(pacific_tz).year
+    current_year = datetime.now(PACIFIC_TZ).year
 
     # Start from January 1st in Pacific time
-    start_date = pacific_tz.localize(datetime(current_year, 1, 1)).astimezone(pytz.UTC)
+    start_date = datetime(current_year, 1, 1, tzinfo=PACIFIC_TZ).astimezone(timezone.utc)
 
     # End at today (midnight) in Pacific time
-    today_pacific = datetime.now(pacific_tz).replace(hour=0, minute=0, second=0, microsecond=0)
-    end_date = today_pacific.astimezone(pytz.UTC)
+    today_pacific = datetime.now(PACIFIC_TZ).replace(hour=0, minute=0, second=0, microsecond=0)
+    end_date = today_pacific.astimezone(timezone.utc)
 
     # Get daily commit counts
     daily_commits = get_daily_commits(GITHUB_USERNAME, GITHUB_TOKEN, start_date, end_date)
@@ -451,7 +436,7 @@ def generate_historical_data():
         cumulative_commits += daily_commits[date_str]
 
         # Get current time in Pacific timezone for last_updated
-        current_pacific_time = datetime.now(pacific_tz)
+        current_pacific_time = datetime.now(PACIFIC_TZ)
 
         # Check if we have existing data for this date
         if date_str in existing_entries:
@@ -473,7 +458,7 @@ def generate_historical_data():
 
         # Always recalculate total_followers and ratio
         total_followers = max(twitter_followers + youtube_subscribers + bluesky_followers, 1)  # Ensure we don't divide by zero
-        ratio = round((github_commits / total_followers) * 10) / 10
+        ratio = calculate_ratio_tenths(github_commits, total_followers) / 10
 
         # Create or update entry for this date
         entry = {
@@ -490,7 +475,8 @@ def generate_historical_data():
         updated_historical_data["data"].append(entry)
 
     # Save updated data to S3
-    save_historical_data_to_s3(updated_historical_data)
+    if not save_historical_data_to_s3(updated_historical_data):
+        return None
 
     logger.info(f"Generated/updated {len(updated_historical_data['data'])} daily entries")
     logger.info(f"Data ranges from {sorted_dates[0]} to {sorted_dates[-1]}")
@@ -511,5 +497,7 @@ if __name__ == "__main__":
         exit(1)
 
     logger.info(f"Generating historical data for GitHub user: {GITHUB_USERNAME}")
-    generate_historical_data()
+    if generate_historical_data() is None:
+        # generate_historical_data.sh relies on the exit status, as this script is the uploader
+        exit(1)
     logger.info("Done!")
\ No newline at end of file
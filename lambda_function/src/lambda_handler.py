@@ -1,15 +1,21 @@
+import asyncio
+import gzip
 import json
 import logging
+import httpx
+import orjson
 import requests
 import os
 import boto3
 # import tweepy  # Remove tweepy import
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from jinja2 import Environment, FileSystemLoader, Template
-import pytz
-from utils import get_html_template, render_html_template, calculate_weekly_activity  # Import the utility functions
+from urllib.parse import parse_qs, urlparse
+from zoneinfo import ZoneInfo
+from utils import render_html_template, calculate_weekly_activity, calculate_ratio_tenths, load_json_body, get_latest_version_id, boto_config  # Import the utility functions
 from youtube_utils import get_youtube_subscriber_count  # Import the YouTube utility function
-from bluesky_utils import BlueskyHelper  # Import the Bluesky utility class
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from botocore.exceptions import ClientError
 
 # Configure logging
@@ -17,23 +23,38 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 # SSM client for retrieving parameters
-ssm_client = boto3.client('ssm')
+ssm_client = boto3.client('ssm', config=boto_config)
 # S3 client for file operations
-s3 = boto3.client('s3')
+s3 = boto3.client('s3', config=boto_config)
 
-def get_parameter(param_name, with_decryption=True):
+# GetParameters accepts at most 10 names per request
+SSM_GET_PARAMETERS_BATCH_SIZE = 10
+
+def get_parameters(param_names):
     """
-    Get a parameter from SSM Parameter Store
+    Get several parameters from SSM Parameter Store in as few requests as possible.
+    Returns a dict of parameter name to value; parameters that could not be
+    retrieved are left out.
     """
-    try:
-        response = ssm_client.get_parameter(
-            Name=param_name,
-            WithDecryption=with_decryption
-        )
-        return response['Parameter']['Value']
-    except Exception as e:
-        logger.error(f"Error retrieving parameter {param_name}: {e}")
-        return None
+    # Skip unset names and duplicates while keeping the order stable
+    names = [name for name in dict.fromkeys(param_names) if name]
+    values = {}
+
+    for i in range(0, len(names), SSM_GET_PARAMETERS_BATCH_SIZE):
+        batch = names[i:i + SSM_GET_PARAMETERS_BATCH_SIZE]
+        try:
+            # Decryption is a no-op for plain String parameters
+            response = ssm_client.get_parameters(Names=batch, WithDecryption=True)
+        except Exception as e:
+            logger.error(f"Error retrieving parameters {', '.join(batch)}: {e}")
+            continue
+
+        for parameter in response['Parameters']:
+            values[parameter['Name']] = parameter['Value']
+        for param_name in response.get('InvalidParameters', []):
+            logger.error(f"Error retrieving parameter {param_name}: parameter not found")
+
+    return values
 
 # Environment variables for parameter names
 GITHUB_TOKEN_PARAM_NAME = os.environ.get("GITHUB_TOKEN_PARAM_NAME")
@@ -49,9 +70,7 @@ BLUESKY_API_KEY_PARAM_NAME = os.environ.get("BLUESKY_API_KEY_PARAM_NAME")
 BLUESKY_USERNAME_PARAM_NAME = os.environ.get("BLUESKY_USERNAME_PARAM_NAME")
 S3_BUCKET = os.environ.get("S3_BUCKET")
 S3_KEY = os.environ.get("S3_KEY", "index.html")
-S3_KEY_BACKUP = os.environ.get("S3_KEY_BACKUP", "index_backup.html")
 S3_HISTORY_KEY = os.environ.get("S3_HISTORY_KEY", "historical_data.json")
-S3_HISTORY_BACKUP_KEY = os.environ.get("S3_HISTORY_BACKUP_KEY", "historical_data_backup.json")
 SSM_PARAM_NAME = os.environ.get('SSM_PARAM_NAME', '/commits-or-clout/historical-data')
 
 # Default values from environment variables
@@ -61,22 +80,109 @@ GITHUB_TOKEN_ORG = os.environ.get("GITHUB_TOKEN_ORG", "")
 TWITTER_USERNAME = os.environ.get("TWITTER_USERNAME", "")
 YOUTUBE_CHANNEL_ID = os.environ.get("YOUTUBE_CHANNEL_ID", "")
 
-# Retrieve actual values from Parameter Store
-GITHUB_TOKEN = get_parameter(GITHUB_TOKEN_PARAM_NAME) or os.environ.get("GITHUB_TOKEN", "")
-GITHUB_USERNAME = get_parameter(GITHUB_USERNAME_PARAM_NAME, False) or GITHUB_USERNAME
-GITHUB_ORGANIZATION = get_parameter(GITHUB_ORGANIZATION_PARAM_NAME, False) or GITHUB_ORGANIZATION
-GITHUB_TOKEN_ORG = get_parameter(GITHUB_TOKEN_ORG_PARAM_NAME) or GITHUB_TOKEN_ORG
-TWITTER_USERNAME = get_parameter(TWITTER_USERNAME_PARAM_NAME, False) or TWITTER_USERNAME
-TWITTER_BEARER_TOKEN = get_parameter(TWITTER_BEARER_TOKEN_PARAM_NAME) or os.environ.get("TWITTER_BEARER_TOKEN", "")
-DISCORD_WEBHOOK_URL = get_parameter(DISCORD_WEBHOOK_URL_PARAM_NAME, False) or os.environ.get("DISCORD_WEBHOOK_URL", "")
-YOUTUBE_API_KEY = get_parameter(YOUTUBE_API_KEY_PARAM_NAME) or os.environ.get("YOUTUBE_API_KEY", "")
-YOUTUBE_CHANNEL_ID = get_parameter(YOUTUBE_CHANNEL_ID_PARAM_NAME, False) or YOUTUBE_CHANNEL_ID
-BLUESKY_API_KEY = get_parameter(BLUESKY_API_KEY_PARAM_NAME) or os.environ.get("BLUESKY_API_KEY", "")
-BLUESKY_USERNAME = get_parameter(BLUESKY_USERNAME_PARAM_NAME) or os.environ.get("BLUESKY_USERNAME", "")
+# Retrieve actual values from Parameter Store in batched requests. This runs once per
+# execution environment at import; warm invocations reuse the module globals below
+# without calling SSM again.
+parameters = get_parameters([
+    GITHUB_TOKEN_PARAM_NAME,
+    GITHUB_USERNAME_PARAM_NAME,
+    GITHUB_ORGANIZATION_PARAM_NAME,
+    GITHUB_TOKEN_ORG_PARAM_NAME,
+    TWITTER_BEARER_TOKEN_PARAM_NAME,
+    TWITTER_USERNAME_PARAM_NAME,
+    DISCORD_WEBHOOK_URL_PARAM_NAME,
+    YOUTUBE_API_KEY_PARAM_NAME,
+    YOUTUBE_CHANNEL_ID_PARAM_NAME,
+    BLUESKY_API_KEY_PARAM_NAME,
+    BLUESKY_USERNAME_PARAM_NAME,
+])
+GITHUB_TOKEN = parameters.get(GITHUB_TOKEN_PARAM_NAME) or os.environ.get("GITHUB_TOKEN", "")
+GITHUB_USERNAME = parameters.get(GITHUB_USERNAME_PARAM_NAME) or GITHUB_USERNAME
+GITHUB_ORGANIZATION = parameters.get(GITHUB_ORGANIZATION_PARAM_NAME) or GITHUB_ORGANIZATION
+GITHUB_TOKEN_ORG = parameters.get(GITHUB_TOKEN_ORG_PARAM_NAME) or GITHUB_TOKEN_ORG
+TWITTER_USERNAME = parameters.get(TWITTER_USERNAME_PARAM_NAME) or TWITTER_USERNAME
+TWITTER_BEARER_TOKEN = parameters.get(TWITTER_BEARER_TOKEN_PARAM_NAME) or os.environ.get("TWITTER_BEARER_TOKEN", "")
+DISCORD_WEBHOOK_URL = parameters.get(DISCORD_WEBHOOK_URL_PARAM_NAME) or os.environ.get("DISCORD_WEBHOOK_URL", "")
+YOUTUBE_API_KEY = parameters.get(YOUTUBE_API_KEY_PARAM_NAME) or os.environ.get("YOUTUBE_API_KEY", "")
+YOUTUBE_CHANNEL_ID = parameters.get(YOUTUBE_CHANNEL_ID_PARAM_NAME) or YOUTUBE_CHANNEL_ID
+BLUESKY_API_KEY = parameters.get(BLUESKY_API_KEY_PARAM_NAME) or os.environ.get("BLUESKY_API_KEY", "")
+BLUESKY_USERNAME = parameters.get(BLUESKY_USERNAME_PARAM_NAME) or os.environ.get("BLUESKY_USERNAME", "")
 
 # Maximum Discord message length
 MAX_DISCORD_MESSAGE_LENGTH = 2000
 
+# Shared HTTP session so GitHub, Twitter and Discord calls reuse pooled keep-alive connections
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+))
+
+# Timezone used for daily historical entries
+PACIFIC_TZ = ZoneInfo('America/Los_Angeles')
+
+# Concurrency limits for the GitHub commit counting client
+GITHUB_MAX_CONNECTIONS = 20
+GITHUB_MAX_CONCURRENT_REQUESTS = 20
+GITHUB_TIMEOUT_SECONDS = 30
+# Concurrent requests used to fetch the remaining pages of a repository listing
+GITHUB_PAGE_FETCH_WORKERS = 10
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+USER_ID_QUERY = """
+query($login: String!) {
+  user(login: $login) { id }
+}
+"""
+
+# Lists a page of branches together with the first page of the author's commits on each one
+REPOSITORY_COMMITS_QUERY = """
+query($owner: String!, $name: String!, $authorId: ID!, $since: GitTimestamp!, $refsCursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100, after: $refsCursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        target {
+          ... on Commit {
+            history(first: 100, author: {id: $authorId}, since: $since) {
+              pageInfo { hasNextPage endCursor }
+              nodes { oid }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Fetches further pages of the author's commits on a single branch
+BRANCH_COMMITS_QUERY = """
+query($owner: String!, $name: String!, $qualifiedName: String!, $authorId: ID!, $since: GitTimestamp!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    ref(qualifiedName: $qualifiedName) {
+      target {
+        ... on Commit {
+          history(first: 100, after: $cursor, author: {id: $authorId}, since: $since) {
+            pageInfo { hasNextPage endCursor }
+            nodes { oid }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Historical data kept in memory across warm invocations, validated against the S3 ETag
+historical_data_cache = {"etag": None, "data": None}
+# Commit SHAs per repository, reused across warm invocations until the repository is pushed to again
+repository_commits_cache = {}
+# Pages of GitHub repository listings, (url, page) -> (etag, items, last page), revalidated with If-None-Match
+repository_page_cache = {}
+
 def send_discord_alert(message):
     """
     Send an alert message to Discord webhook
@@ -94,7 +200,7 @@ def send_discord_alert(message):
     }
 
     try:
-        response = requests.post(
+        response = http_session.post(
             DISCORD_WEBHOOK_URL,
             json=payload,
             headers={"Content-Type": "application/json"}
@@ -106,6 +212,57 @@ def send_discord_alert(message):
         logger.error(f"Failed to send Discord alert: {e}")
         return False
 
+def fetch_listing_page(url, headers, params, page):
+    """
+    Fetch one page of a paginated GitHub listing. A page cached by an earlier invocation is
+    revalidated with its ETag; a 304 costs no rate limit and skips downloading and parsing it.
+    Returns (items, last_page), with last_page read from the rel="last" link.
+    """
+    cache_key = (url, page)
+    cached = repository_page_cache.get(cache_key)
+    request_headers = {**headers, "If-None-Match": cached[0]} if cached else headers
+
+    response = http_session.get(url, headers=request_headers, params={**params, "page": page})
+    logger.debug("GitHub listing %s page %s: %s", url, page, response.status_code)
+    if cached and response.status_code == 304:
+        return cached[1], cached[2]
+
+    response.raise_for_status()
+    items = orjson.loads(response.content)
+    last_link = response.links.get("last")
+    last_page = int(parse_qs(urlparse(last_link["url"]).query)["page"][0]) if last_link else page
+
+    etag = response.headers.get("ETag")
+    if etag:
+        repository_page_cache[cache_key] = (etag, items, last_page)
+    return items, last_page
+
+
+def fetch_all_pages(url, headers, params):
+    """
+    Fetch every page of a paginated GitHub listing. The first page gives the page count,
+    then pages 2..N are fetched concurrently. Returns a new list of all items in order.
+    """
+    first_page, last_page = fetch_listing_page(url, headers, params, 1)
+    pages = [first_page]
+
+    def fetch_page(page):
+        return fetch_listing_page(url, headers, params, page)[0]
+
+    if last_page > 1:
+        with ThreadPoolExecutor(max_workers=min(GITHUB_PAGE_FETCH_WORKERS, last_page - 1)) as executor:
+            pages.extend(executor.map(fetch_page, range(2, last_page + 1)))
+
+    # A 304 only says a page is unchanged, not that the page count is: a new repository can
+    # push the listing over a per_page boundary, so keep going while the last page is full
+    while len(pages[-1]) == params["per_page"]:
+        last_page += 1
+        pages.append(fetch_page(last_page))
+
+    logger.debug("Fetched pages 1-%s of %s", last_page, url)
+    return [item for page in pages for item in page]
+
+
 def get_user_repositories(username, token):
     """
     Fetch all repositories for a GitHub user.
@@ -119,43 +276,10 @@ def get_user_repositories(username, token):
     params = {
         "per_page": 100,
         "type": "all",
-    }  # Correct parameters
-    all_repos = []
+    }
 
     try:
-        page = 1
-        while True:
-            params["page"] = page
-            response = requests.get(url, headers=headers, params=params)
-
-            # Log the response status and headers for debugging
-            logger.info(f"API Response Status: {response.status_code}")
-            logger.info(f"API Response Headers: {response.headers}")
-
-            response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-            repos = response.json()
-
-            if not repos:  # No more repositories
-                logger.info(f"No more repositories found on page {page}")
-                break
-
-            all_repos.extend(repos)
-            logger.info(f"Fetched page {page} with {len(repos)} repositories")
-
-            # Check if there's a next page using Link header
-            if "Link" in response.headers:
-                if 'rel="next"' not in response.headers["Link"]:
-                    logger.info("No more pages according to Link header")
-                    break
-            else:
-                # If no Link header and we got less than per_page results, we're done
-                if len(repos) < params["per_page"]:
-                    logger.info(
-                        "Got fewer results than per_page limit, assuming last page"
-                    )
-                    break  # This is the problem.  Remove this break.
-
-            page += 1
+        all_repos = fetch_all_pages(url, headers, params)
 
         logger.info(f"Found {len(all_repos)} repositories for user {username}")
         return all_repos
@@ -181,34 +305,9 @@ def get_organization_repositories(organization, token):
         "per_page": 100,
         "type": "all",
     }
-    all_repos = []
 
     try:
-        page = 1
-        while True:
-            params["page"] = page
-            response = requests.get(url, headers=headers, params=params)
-            logger.info(f"Organization API Response Status: {response.status_code}")
-
-            response.raise_for_status()
-            repos = response.json()
-
-            if not repos:  # No more repositories
-                break
-
-            all_repos.extend(repos)
-            logger.info(f"Fetched page {page} with {len(repos)} organization repositories")
-
-            # Check if there's a next page using Link header
-            if "Link" in response.headers:
-                if 'rel="next"' not in response.headers["Link"]:
-                    break
-            else:
-                # If no Link header and we got less than per_page results, we're done
-                if len(repos) < params["per_page"]:
-                    break
-
-            page += 1
+        all_repos = fetch_all_pages(url, headers, params)
 
         logger.info(f"Found {len(all_repos)} repositories for organization {organization}")
         return all_repos
@@ -226,149 +325,222 @@ def get_all_repositories(username, user_token, organization=None, org_token=None
     Uses appropriate tokens for each type of repository.
     Returns a combined list of repositories.
     """
-    all_repos = []
+    # Keyed on full_name so a repository listed under both the user and the
+    # organization is only counted once
+    repos_by_name = {}
+
+    # The user and organization listings are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        user_future = executor.submit(get_user_repositories, username, user_token)
+
+        org_future = None
+        if organization:
+            # Use organization token if provided, otherwise fall back to user token
+            token_to_use = org_token if org_token else user_token
+            org_future = executor.submit(get_organization_repositories, organization, token_to_use)
+
+        user_repos = user_future.result()
+        for repo in user_repos:
+            repos_by_name.setdefault(repo["full_name"], repo)
+        logger.info(f"Added {len(user_repos)} user repositories")
+
+        if org_future:
+            org_repos = org_future.result()
+            for repo in org_repos:
+                repos_by_name.setdefault(repo["full_name"], repo)
+            logger.info(f"Added {len(org_repos)} organization repositories")
+
+    all_repos = list(repos_by_name.values())
+    logger.info(f"Total repositories: {len(all_repos)}")
+    return all_repos
 
-    # Get user repositories using user token
-    user_repos = get_user_repositories(username, user_token)
-    all_repos.extend(user_repos)
-    logger.info(f"Added {len(user_repos)} user repositories")
 
-    # Get organization repositories if organization is specified
-    if organization:
-        # Use organization token if provided, otherwise fall back to user token
-        token_to_use = org_token if org_token else user_token
-        org_repos = get_organization_repositories(organization, token_to_use)
-        all_repos.extend(org_repos)
-        logger.info(f"Added {len(org_repos)} organization repositories")
+async def run_graphql_query(client, request_limit, token, query, variables):
+    """
+    POST a query to the GitHub GraphQL API and return its data.
+    request_limit is a semaphore shared by all queries of one run, capping how many are in flight.
+    Raises RuntimeError if the API reports errors in the response body.
+    """
+    async with request_limit:
+        response = await client.post(
+            GITHUB_GRAPHQL_URL,
+            headers={"Authorization": f"Bearer {token}"},
+            json={"query": query, "variables": variables}
+        )
+    response.raise_for_status()
+    payload = orjson.loads(response.content)
+    if payload.get("errors"):
+        raise RuntimeError(f"GraphQL errors: {payload['errors']}")
+    return payload["data"]
+
+
+async def get_user_node_id(client, request_limit, username, token):
+    """
+    Look up the GraphQL node ID of a user, which commit history is filtered by.
+    """
+    data = await run_graphql_query(client, request_limit, token, USER_ID_QUERY, {"login": username})
+    return data["user"]["id"]
 
-    logger.info(f"Total repositories: {len(all_repos)}")
-    return all_repos
 
+async def count_branch_commits(client, request_limit, repo_owner, repo_name, branch_name, token, author_id, since, history, unique_commits):
+    """
+    Add the SHAs of all commits authored by author_id since `since` on one branch to unique_commits.
+    `history` is the first page of commits, already returned by the repository query.
+    Returns False if the branch could not be read completely.
+    """
+    try:
+        commits_page = 1
+        while True:
+            # Add unique commit SHAs to our set
+            unique_commits.update(commit["oid"] for commit in history["nodes"])
+
+            logger.debug("Found %s commits in branch %s of repo %s (page %s)", len(history['nodes']), branch_name, repo_name, commits_page)
+
+            if not history["pageInfo"]["hasNextPage"]:
+                break
+
+            data = await run_graphql_query(client, request_limit, token, BRANCH_COMMITS_QUERY, {
+                "owner": repo_owner,
+                "name": repo_name,
+                "qualifiedName": f"refs/heads/{branch_name}",
+                "authorId": author_id,
+                "since": since,
+                "cursor": history["pageInfo"]["endCursor"]
+            })
+            ref = data["repository"] and data["repository"]["ref"]
+            if not ref:
+                # The branch was deleted between pages, e.g. after its PR was merged
+                logger.warning(f"Branch {branch_name} in repo {repo_name} disappeared while paging its commits")
+                return False
+            history = ref["target"]["history"]
+            commits_page += 1
+
+        return True
+    except (httpx.HTTPError, RuntimeError) as e:
+        # Skip the rest of this branch instead of failing the whole repository
+        logger.warning(f"Error fetching commits for branch {branch_name} in repo {repo_name}: {e}")
+        return False
+
+
+async def count_repository_commits(client, request_limit, repo, token, author_id, since, unique_commits):
+    """
+    Add the SHAs of all commits authored by author_id since `since` across every branch
+    of a repository to unique_commits.
+    """
+    repo_name = repo['name']
+    repo_owner = repo['owner']['login']
+
+    # Any push to any branch moves pushed_at, so an unchanged value means the cached SHAs are still complete
+    cache_key = (repo['full_name'], author_id, since)
+    pushed_at = repo.get('pushed_at')
+    cached = repository_commits_cache.get(cache_key)
+    if cached and pushed_at and cached[0] == pushed_at:
+        unique_commits.update(cached[1])
+        logger.info(f"No pushes to repo {repo_name} since last invocation, reusing {len(cached[1])} cached commits")
+        return
+
+    # Determine which token to use based on repository owner
+    if repo_owner == GITHUB_ORGANIZATION and GITHUB_TOKEN_ORG:
+        repo_token = GITHUB_TOKEN_ORG
+        logger.debug("Using organization token for repo %s/%s", repo_owner, repo_name)
+    else:
+        repo_token = token
+        logger.debug("Using user token for repo %s/%s", repo_owner, repo_name)
+
+    # Each page of branches comes back with the first page of the user's commits on each of them
+    branches = []
+    variables = {"owner": repo_owner, "name": repo_name, "authorId": author_id, "since": since, "refsCursor": None}
+
+    try:
+        while True:
+            data = await run_graphql_query(client, request_limit, repo_token, REPOSITORY_COMMITS_QUERY, variables)
+            if not data["repository"]:
+                raise RuntimeError("repository not found")
+            refs = data["repository"]["refs"]
+            branches.extend(refs["nodes"])
+            logger.debug("Fetched %s branches for repo %s", len(refs['nodes']), repo_name)
+
+            if not refs["pageInfo"]["hasNextPage"]:
+                break
+            variables["refsCursor"] = refs["pageInfo"]["endCursor"]
+
+        logger.info(f"Found {len(branches)} branches in repo {repo_name}")
+    except (httpx.HTTPError, RuntimeError) as e:
+        error_msg = f"Error fetching branches for repo {repo_name}: {e}"
+        logger.error(error_msg)
+        # Send error to Discord but continue with other repositories
+        await asyncio.to_thread(send_discord_alert, f"⚠️ {error_msg}")
+        return
+
+    # Follow up on any branch with more than one page of commits concurrently
+    repo_commits = set()
+    results = await asyncio.gather(*(
+        count_branch_commits(client, request_limit, repo_owner, repo_name, branch["name"], repo_token, author_id, since, branch["target"]["history"], repo_commits)
+        for branch in branches
+        # Branches normally point at commits, but refs/heads can technically hold other objects
+        if branch["target"] and "history" in branch["target"]
+    ))
+    unique_commits.update(repo_commits)
+
+    # Only cache a complete result, otherwise a skipped branch would stay missing until the next push
+    if pushed_at and all(results):
+        repository_commits_cache[cache_key] = (pushed_at, frozenset(repo_commits))
+
+    logger.info(f"Finished counting commits in repo {repo_name} since Jan 1")
+
+
+async def collect_unique_commits(repositories, username, token, since):
+    """
+    Count commits for all repositories and branches concurrently over a shared HTTP/2 client.
+    HTTP/2 multiplexes every request over one connection, so the connection limit does not bound
+    concurrency; a semaphore caps in-flight queries instead, to stay clear of secondary rate limits.
+    Returns the set of unique commit SHAs.
+    """
+    unique_commits = set()
+    # Created here so it belongs to the event loop asyncio.run started for this invocation
+    request_limit = asyncio.Semaphore(GITHUB_MAX_CONCURRENT_REQUESTS)
+    limits = httpx.Limits(max_connections=GITHUB_MAX_CONNECTIONS)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=GITHUB_TIMEOUT_SECONDS) as client:
+        author_id = await get_user_node_id(client, request_limit, username, token)
+        await asyncio.gather(*(
+            count_repository_commits(client, request_limit, repo, token, author_id, since, unique_commits)
+            for repo in repositories
+        ))
+    return unique_commits
+
+
+def pushed_since(repo, since_datetime):
+    """
+    Whether a repository from the REST listing has been pushed to at or after since_datetime.
+    Repositories without a pushed_at (e.g. empty ones) are kept to be safe.
+    """
+    pushed_at = repo.get('pushed_at')
+    if not pushed_at:
+        return True
+    return datetime.fromisoformat(pushed_at.replace("Z", "+00:00")) >= since_datetime
 
 def get_commits_since_jan_1(username, token):
     """
     Fetch the number of commits made to all GitHub repositories since January 1st across all branches.
     Returns None if there's an error.
     """
-    current_year = datetime.now().year
-    since = datetime(current_year, 1, 1, tzinfo=timezone.utc).isoformat()
-
-    # Use a set to track unique commit SHAs to avoid counting duplicates
-    unique_commits = set()
+    # Jan 1 in Pacific time, the same year boundary as the page headline and the historical backfill
+    current_year = datetime.now(PACIFIC_TZ).year
+    since_datetime = datetime(current_year, 1, 1, tzinfo=PACIFIC_TZ).astimezone(timezone.utc)
+    since = since_datetime.isoformat()
 
     try:
         # First get all repositories (user + organization) using appropriate tokens
         repositories = get_all_repositories(username, token, GITHUB_ORGANIZATION, GITHUB_TOKEN_ORG)
 
-        for repo in repositories:
-            repo_name = repo['name']
-            repo_owner = repo['owner']['login']
-
-            # Determine which token to use based on repository owner
-            if repo_owner == GITHUB_ORGANIZATION and GITHUB_TOKEN_ORG:
-                repo_token = GITHUB_TOKEN_ORG
-                logger.info(f"Using organization token for repo {repo_owner}/{repo_name}")
-            else:
-                repo_token = token
-                logger.info(f"Using user token for repo {repo_owner}/{repo_name}")
-
-            # Create headers with the appropriate token
-            repo_headers = {
-                "Authorization": f"Bearer {repo_token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            }
-
-            # First get all branches for this repository
-            branches_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/branches"
-            branches_params = {"per_page": 100}
-            branches = []
+        # A commit made since Jan 1 can only have been pushed after that, so repositories
+        # with no push this year cannot contribute any and are skipped without a request
+        active_repositories = [repo for repo in repositories if pushed_since(repo, since_datetime)]
+        logger.info(f"{len(active_repositories)} of {len(repositories)} repositories pushed to since Jan 1")
+        repositories = active_repositories
 
-            try:
-                # Fetch all branches
-                branches_page = 1
-                while True:
-                    branches_params["page"] = branches_page
-                    branches_response = requests.get(branches_url, headers=repo_headers, params=branches_params)
-                    branches_response.raise_for_status()
-                    page_branches = branches_response.json()
-
-                    if not page_branches:
-                        break
-
-                    branches.extend(page_branches)
-                    logger.info(f"Fetched page {branches_page} with {len(page_branches)} branches for repo {repo_name}")
-
-                    # Check if we need to fetch more pages
-                    if len(page_branches) < branches_params["per_page"]:
-                        break
-
-                    # Check if there's a next page using Link header
-                    if "Link" in branches_response.headers:
-                        if 'rel="next"' not in branches_response.headers["Link"]:
-                            break
-
-                    branches_page += 1
-
-                logger.info(f"Found {len(branches)} branches in repo {repo_name}")
-
-                # If no branches were found, try the default branch
-                if not branches:
-                    logger.info(f"No branches found for {repo_name}, trying default branch")
-                    branches = [{"name": repo.get("default_branch", "main")}]
-
-                # Now get commits for each branch
-                for branch in branches:
-                    branch_name = branch["name"]
-                    commits_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/commits"
-                    commits_params = {
-                        "since": since,
-                        "per_page": 100,
-                        "author": username,
-                        "sha": branch_name
-                    }
-
-                    try:
-                        commits_page = 1
-                        while True:
-                            commits_params["page"] = commits_page
-                            commits_response = requests.get(commits_url, headers=repo_headers, params=commits_params)
-                            commits_response.raise_for_status()
-                            commits = commits_response.json()
-
-                            if not commits:
-                                break
-
-                            # Add unique commit SHAs to our set
-                            for commit in commits:
-                                unique_commits.add(commit["sha"])
-
-                            logger.info(f"Found {len(commits)} commits in branch {branch_name} of repo {repo_name} (page {commits_page})")
-
-                            # Check if we need to fetch more pages
-                            if len(commits) < commits_params["per_page"]:
-                                break
-
-                            # Check if there's a next page using Link header
-                            if "Link" in commits_response.headers:
-                                if 'rel="next"' not in commits_response.headers["Link"]:
-                                    break
-
-                            commits_page += 1
-
-                    except requests.exceptions.RequestException as e:
-                        logger.warning(f"Error fetching commits for branch {branch_name} in repo {repo_name}: {e}")
-                        # Continue with other branches instead of failing completely
-                        continue
-
-                logger.info(f"Found {len(unique_commits)} unique commits in repo {repo_name} since Jan 1")
-
-            except requests.exceptions.RequestException as e:
-                error_msg = f"Error fetching branches for repo {repo_name}: {e}"
-                logger.error(error_msg)
-                # Send error to Discord but continue with other repositories
-                send_discord_alert(f"⚠️ {error_msg}")
-                continue
+        # Use a set to track unique commit SHAs to avoid counting duplicates
+        unique_commits = asyncio.run(collect_unique_commits(repositories, username, token, since))
 
         total_commits = len(unique_commits)
         logger.info(f"Found total of {total_commits} unique commits across all repositories and branches since Jan 1")
@@ -394,9 +566,9 @@ def get_follower_count(username, bearer_token):
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = http_session.get(url, headers=headers, params=params)
         response.raise_for_status()
-        user_data = response.json()
+        user_data = orjson.loads(response.content)
 
         if "data" in user_data and "public_metrics" in user_data["data"]:
             followers_count = user_data["data"]["public_metrics"]["followers_count"]
@@ -413,39 +585,57 @@ def get_follower_count(username, bearer_token):
         send_discord_alert(f"⚠️ {error_msg}")
         return None
 
+def get_bluesky_followers(api_key, username):
+    """
+    Fetch the follower count for a Bluesky user.
+    Returns None if Bluesky is not configured or the lookup fails.
+    """
+    if not (api_key and username):
+        return None
+
+    # atproto (and pydantic under it) is the slowest import in the package, so load it
+    # here, in the worker thread, rather than on the cold start path
+    from bluesky_utils import BlueskyHelper
+
+    logger.info(f"Fetching Bluesky followers for {username}")
+    bluesky_helper = BlueskyHelper(api_key)
+    return bluesky_helper.get_total_followers(username)
+
 def get_historical_data():
     """
     Fetch historical data from S3 bucket
     """
     try:
-        response = s3.get_object(Bucket=S3_BUCKET, Key=S3_HISTORY_KEY)
-        historical_data = json.loads(response['Body'].read().decode('utf-8'))
+        get_kwargs = {}
+        if historical_data_cache["etag"]:
+            get_kwargs["IfNoneMatch"] = historical_data_cache["etag"]
+        response = s3.get_object(Bucket=S3_BUCKET, Key=S3_HISTORY_KEY, **get_kwargs)
+        historical_data = load_json_body(response)
+        historical_data_cache.update(etag=response['ETag'], data=historical_data)
         logger.info(f"Successfully retrieved historical data from S3")
         return historical_data
     except s3.exceptions.NoSuchKey:
-        logger.info(f"No historical data found, trying to restore from backup")
+        logger.info(f"No historical data found, trying to restore from a previous version")
         try:
-            # Try to restore from backup
-            response = s3.get_object(Bucket=S3_BUCKET, Key=S3_HISTORY_BACKUP_KEY)
-            historical_data = json.loads(response['Body'].read().decode('utf-8'))
-            logger.info(f"Successfully restored historical data from backup")
-
-            # Save the restored data to the main file
-            s3.put_object(
-                Bucket=S3_BUCKET,
-                Key=S3_HISTORY_KEY,
-                Body=json.dumps(historical_data, indent=2).encode('utf-8'),
-                ContentType='application/json'
-            )
-            logger.info(f"Restored backup data to main historical data file")
-
+            # Try to restore from the most recent noncurrent version
+            version_id = get_latest_version_id(s3, S3_BUCKET, S3_HISTORY_KEY)
+            if version_id is None:
+                logger.info(f"No previous version of historical data found either, creating new dataset")
+                return {"data": []}
+            response = s3.get_object(Bucket=S3_BUCKET, Key=S3_HISTORY_KEY, VersionId=version_id)
+            historical_data = load_json_body(response)
+            logger.info(f"Successfully restored historical data from version {version_id}")
             return historical_data
-        except s3.exceptions.NoSuchKey:
-            logger.info(f"No backup historical data found either, creating new dataset")
-            return {"data": []}
         except Exception as e:
-            logger.error(f"Error restoring from backup: {e}")
+            logger.error(f"Error restoring from previous version: {e}")
             return {"data": []}
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('304', 'NotModified'):
+            logger.info(f"Historical data unchanged since last invocation, using cached copy")
+            return historical_data_cache["data"]
+        logger.error(f"Error retrieving historical data: {e}")
+        send_discord_alert(f"⚠️ Error retrieving historical data: {e}")
+        return {"data": []}
     except Exception as e:
         logger.error(f"Error retrieving historical data: {e}")
         send_discord_alert(f"⚠️ Error retrieving historical data: {e}")
@@ -457,8 +647,7 @@ def update_historical_data(historical_data, commit_count, follower_count, ratio,
     If any data point is None, use the most recent value from historical data.
     """
     # Get current date in PST timezone (without time)
-    pacific_tz = pytz.timezone('America/Los_Angeles')
-    current_datetime = datetime.now(pacific_tz)
+    current_datetime = datetime.now(PACIFIC_TZ)
     current_date = current_datetime.strftime("%Y-%m-%d")
 
     # Get the most recent entry to use as fallback for missing data
@@ -489,15 +678,11 @@ def update_historical_data(historical_data, commit_count, follower_count, ratio,
     logger.info(f"Calculated total followers: {total_followers}")
 
     # Always recalculate ratio after ensuring commit_count and total_followers are not None
-    ratio = round((commit_count / total_followers if total_followers > 0 else 1) * 10) / 10
+    ratio = calculate_ratio_tenths(commit_count, total_followers) / 10
     logger.info(f"Calculated ratio: {ratio}")
 
-    # Check if we already have an entry for today
-    today_entry = None
-    for entry in historical_data["data"]:
-        if entry.get("date") == current_date:
-            today_entry = entry
-            break
+    # Entries are appended in date order, so only the most recent one can be today's
+    today_entry = most_recent_entry if most_recent_entry and most_recent_entry.get("date") == current_date else None
 
     # Update existing entry or create a new one
     if today_entry:
@@ -529,34 +714,23 @@ def save_historical_data(historical_data):
     Save historical data to S3 bucket
     """
     try:
-        # First, create a backup of the existing data
-        try:
-            # Check if the file exists before trying to copy it
-            s3.head_object(Bucket=S3_BUCKET, Key=S3_HISTORY_KEY)
+        body = orjson.dumps(historical_data)
 
-            # Copy the existing file to a backup
-            s3.copy_object(
-                Bucket=S3_BUCKET,
-                CopySource={'Bucket': S3_BUCKET, 'Key': S3_HISTORY_KEY},
-                Key=S3_HISTORY_BACKUP_KEY
-            )
-            logger.info(f"Created backup of historical data at s3://{S3_BUCKET}/{S3_HISTORY_BACKUP_KEY}")
-        except s3.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                logger.info(f"No existing historical data file to backup")
-            else:
-                logger.warning(f"Error creating backup of historical data: {e}")
-
-        # Now save the new data
-        s3.put_object(
+        # The bucket is versioned, so the previous object is kept as a noncurrent version
+        response = s3.put_object(
             Bucket=S3_BUCKET,
             Key=S3_HISTORY_KEY,
-            Body=json.dumps(historical_data, indent=2).encode('utf-8'),
-            ContentType='application/json'
+            Body=gzip.compress(body, compresslevel=6),
+            ContentType='application/json',
+            ContentEncoding='gzip'
         )
+        # What we just wrote is what the next warm invocation will read back
+        historical_data_cache.update(etag=response['ETag'], data=historical_data)
         logger.info(f"Successfully saved historical data to S3")
         return True
     except Exception as e:
+        # The cached copy may hold unsaved changes, so force a fresh read next time
+        historical_data_cache.update(etag=None, data=None)
         logger.error(f"Error saving historical data: {e}")
         send_discord_alert(f"❌ Error saving historical data: {e}")
         return False
@@ -574,7 +748,9 @@ def handler(event, context):
     """
     import time
     start_time = time.time()
-    logger.info("Lambda function invoked with event: %s", json.dumps(event))
+    logger.info("Lambda function invoked")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Lambda event: %s", json.dumps(event))
 
     try:
         # Check if required environment variables are set
@@ -592,50 +768,42 @@ def handler(event, context):
                 'body': json.dumps({'error': error_msg})
             }
 
-        # Get historical data first to have fallback values available
-        logger.info("Fetching historical data...")
-        historical_data_start = time.time()
-        historical_data = get_historical_data()
-        logger.info(f"Historical data fetched in {time.time() - historical_data_start:.2f} seconds")
-
-        # Get GitHub commits and Twitter followers
-        logger.info("Fetching GitHub commits...")
-        github_start = time.time()
-        commit_count = get_commits_since_jan_1(GITHUB_USERNAME, GITHUB_TOKEN)
-        logger.info(f"GitHub commits fetched in {time.time() - github_start:.2f} seconds: {commit_count}")
-
-        logger.info("Fetching Twitter followers...")
-        twitter_start = time.time()
-        follower_count = get_follower_count(TWITTER_USERNAME, TWITTER_BEARER_TOKEN)
-        logger.info(f"Twitter followers fetched in {time.time() - twitter_start:.2f} seconds: {follower_count}")
-
-        # Get YouTube subscribers
-        youtube_subscribers = None
-        try:
-            logger.info("Fetching YouTube subscribers...")
-            youtube_start = time.time()
-            youtube_subscribers = get_youtube_subscriber_count(YOUTUBE_API_KEY, YOUTUBE_CHANNEL_ID)
-            logger.info(f"YouTube subscribers fetched in {time.time() - youtube_start:.2f} seconds: {youtube_subscribers}")
-        except Exception as e:
-            error_msg = f"Error fetching YouTube subscribers: {e}"
-            logger.error(error_msg)
-            send_discord_alert(f"⚠️ {error_msg}")
+        # All data sources are independent, so fetch them concurrently
+        logger.info("Fetching historical data, GitHub commits, Twitter, YouTube and Bluesky followers...")
+        fetch_start = time.time()
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            historical_data_future = executor.submit(get_historical_data)
+            commit_count_future = executor.submit(get_commits_since_jan_1, GITHUB_USERNAME, GITHUB_TOKEN)
+            follower_count_future = executor.submit(get_follower_count, TWITTER_USERNAME, TWITTER_BEARER_TOKEN)
+            youtube_subscribers_future = executor.submit(get_youtube_subscriber_count, YOUTUBE_API_KEY, YOUTUBE_CHANNEL_ID)
+            bluesky_followers_future = executor.submit(get_bluesky_followers, BLUESKY_API_KEY, BLUESKY_USERNAME)
+
+            historical_data = historical_data_future.result()
+            commit_count = commit_count_future.result()
+            follower_count = follower_count_future.result()
+
+            # Get YouTube subscribers
             youtube_subscribers = None
+            try:
+                youtube_subscribers = youtube_subscribers_future.result()
+            except Exception as e:
+                error_msg = f"Error fetching YouTube subscribers: {e}"
+                logger.error(error_msg)
+                send_discord_alert(f"⚠️ {error_msg}")
 
-        # Get Bluesky followers
-        bluesky_followers = None
-        try:
-            if BLUESKY_API_KEY and BLUESKY_USERNAME:
-                logger.info(f"Fetching Bluesky followers for {BLUESKY_USERNAME}")
-                bluesky_start = time.time()
-                bluesky_helper = BlueskyHelper(BLUESKY_API_KEY)
-                bluesky_followers = bluesky_helper.get_total_followers(BLUESKY_USERNAME)
-                logger.info(f"Bluesky followers fetched in {time.time() - bluesky_start:.2f} seconds: {bluesky_followers}")
-        except Exception as e:
-            error_msg = f"Error fetching Bluesky followers: {e}"
-            logger.error(error_msg)
-            send_discord_alert(f"⚠️ {error_msg}")
+            # Get Bluesky followers
             bluesky_followers = None
+            try:
+                bluesky_followers = bluesky_followers_future.result()
+            except Exception as e:
+                error_msg = f"Error fetching Bluesky followers: {e}"
+                logger.error(error_msg)
+                send_discord_alert(f"⚠️ {error_msg}")
+        logger.info(f"All data sources fetched in {time.time() - fetch_start:.2f} seconds")
+        logger.info(
+            f"GitHub commits: {commit_count}, Twitter followers: {follower_count}, "
+            f"YouTube subscribers: {youtube_subscribers}, Bluesky followers: {bluesky_followers}"
+        )
 
         # We'll calculate the ratio inside update_historical_data after ensuring values are not None
         # So pass None for ratio here
@@ -698,7 +866,8 @@ def handler(event, context):
             commits_today,  # Pass the commits made today
             followers_today,  # Pass the followers gained today
             commits_week,  # Pass the commits made this week
-            followers_week  # Pass the followers gained this week
+            followers_week,  # Pass the followers gained this week
+            gzip_encoded=True  # Served with Content-Encoding: gzip
         )
         logger.info(f"HTML template rendered in {time.time() - render_start:.2f} seconds")
 
@@ -707,30 +876,13 @@ def handler(event, context):
             logger.info("Uploading to S3...")
             s3_start = time.time()
 
-            # First, create a backup of the existing index.html
-            try:
-                # Check if the file exists before trying to copy it
-                s3.head_object(Bucket=S3_BUCKET, Key=S3_KEY)
-
-                # Copy the existing file to a backup
-                s3.copy_object(
-                    Bucket=S3_BUCKET,
-                    CopySource={'Bucket': S3_BUCKET, 'Key': S3_KEY},
-                    Key=S3_KEY_BACKUP
-                )
-                logger.info(f"Created backup of index.html at s3://{S3_BUCKET}/{S3_KEY_BACKUP}")
-            except s3.exceptions.ClientError as e:
-                if e.response['Error']['Code'] == '404':
-                    logger.info(f"No existing index.html file to backup")
-                else:
-                    logger.warning(f"Error creating backup of index.html: {e}")
-
-            # Upload HTML file
+            # Upload HTML file (previous versions are retained by bucket versioning)
             s3.put_object(
                 Bucket=S3_BUCKET,
                 Key=S3_KEY,
-                Body=html_content.encode('utf-8'),
+                Body=html_content,
                 ContentType='text/html',
+                ContentEncoding='gzip',
                 CacheControl='max-age=1800'  # 30 minutes in seconds, matching the Lambda schedule
             )
             logger.info(f"S3 upload completed in {time.time() - s3_start:.2f} seconds")
@@ -9,7 +9,7 @@ This script allows you to test the Lambda handler locally by:
 """
 
 import os
-import json
+import orjson
 import sys
 import logging
 from pathlib import Path
@@ -22,43 +22,39 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Entries shown when listing the project directory after a missing .env
+MAX_LISTED_ENTRIES = 20
+
 # Find and load the .env file BEFORE importing the lambda_handler
-current_dir = Path(__file__).parent
+current_dir = Path(__file__).resolve().parent
 project_root = current_dir.parent
 env_path = project_root / '.env'
 
 print(f"Looking for .env file at: {env_path}")
 if env_path.exists():
     print(f".env file found!")
-    # Load environment variables from .env file
+    # Load environment variables from .env file, overriding anything already set
     load_dotenv(dotenv_path=env_path, override=True)
-    
-    # Manually load environment variables to ensure they're set
-    try:
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    try:
-                        key, value = line.split('=', 1)
-                        os.environ[key.strip()] = value.strip()
-                    except ValueError:
-                        # Skip lines that don't have a key=value format
-                        continue
-    except Exception as e:
-        print(f"Error manually loading .env file: {e}")
 else:
     print(f"ERROR: .env file not found at {env_path}")
     print("Current directory structure:")
-    for item in project_root.iterdir():
-        print(f"  {item}")
+    # Cap the listing so a directory with a large .venv or node_modules doesn't flood the output
+    with os.scandir(project_root) as entries:
+        for index, entry in enumerate(entries):
+            if index >= MAX_LISTED_ENTRIES:
+                print("  ...")
+                break
+            print(f"  {entry.path}")
     sys.exit(1)
 
-# Now import the lambda_handler after environment variables are set
-from lambda_handler import handler
-
 class MockContext:
     """Mock Lambda context object"""
+    __slots__ = (
+        "function_name", "function_version", "invoked_function_arn",
+        "memory_limit_in_mb", "aws_request_id", "log_group_name",
+        "log_stream_name", "identity", "client_context", "remaining_time_in_millis",
+    )
+
     def __init__(self):
         self.function_name = "local-lambda-runner"
         self.function_version = "$LATEST"
@@ -74,15 +70,21 @@ class MockContext:
     def get_remaining_time_in_millis(self):
         return self.remaining_time_in_millis
 
+# The handler never mutates the context, so one instance serves every run
+MOCK_CONTEXT = MockContext()
+
 def main():
     """Main function to run the Lambda handler locally"""
     # Check for required environment variables
     required_vars = ["GITHUB_TOKEN", "GITHUB_USERNAME", "TWITTER_BEARER_TOKEN", 
                      "TWITTER_USERNAME", "S3_BUCKET"]
     
-    print("\nEnvironment variables:")
-    for var in required_vars:
-        value = os.environ.get(var)
+    # Read each variable once up front
+    env = os.environ
+    env_values = {var: env.get(var) for var in required_vars}
+
+    lines = ["\nEnvironment variables:"]
+    for var, value in env_values.items():
         # Print first few characters if exists, otherwise "Not set"
         if value:
             # Mask sensitive values
@@ -90,15 +92,20 @@ def main():
                 display_value = value[:4] + "..." + value[-4:] if len(value) > 8 else "***"
             else:
                 display_value = value
-            print(f"  {var}: {display_value}")
+            lines.append(f"  {var}: {display_value}")
         else:
-            print(f"  {var}: Not set")
+            lines.append(f"  {var}: Not set")
+    sys.stdout.write("\n".join(lines) + "\n")
     
+    # Import the handler only now: it reads the environment at import time
+    # and pulls in boto3 and requests, which an early exit never needs
+    from lambda_handler import handler
+
     # Create a mock event (empty for simplicity, but you can customize this)
     event = {}
     
-    # Create a mock context
-    context = MockContext()
+    # Use the shared mock context
+    context = MOCK_CONTEXT
     
     print("\nRunning Lambda handler locally...")
     print("-" * 50)
@@ -113,9 +120,9 @@ def main():
         print(f"Status Code: {result['statusCode']}")
         
         # Parse and pretty print the body
-        body = json.loads(result['body'])
+        body = orjson.loads(result['body'])
         print("Body:")
-        print(json.dumps(body, indent=2))
+        print(orjson.dumps(body, option=orjson.OPT_INDENT_2).decode('utf-8'))
         
         if result['statusCode'] == 200:
             print("\n✅ Lambda executed successfully!")
@@ -2,8 +2,8 @@
 import os
 import sys
 import logging
+from pathlib import Path
 from dotenv import load_dotenv
-from youtube_utils import get_youtube_subscriber_count
 
 # Configure logging
 logging.basicConfig(
@@ -12,18 +12,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The .env file lives in the lambda_function directory, one level above this script
+ENV_PATH = Path(__file__).resolve().parent.parent / '.env'
+
 def main():
     """
     Load environment variables from .env file and print YouTube subscriber count
     """
     # Load environment variables from .env file
-    env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-    if not os.path.exists(env_path):
-        logger.error(f"Environment file not found at {env_path}")
+    if not ENV_PATH.exists():
+        logger.error(f"Environment file not found at {ENV_PATH}")
         sys.exit(1)
     
-    load_dotenv(env_path)
-    logger.info(f"Loaded environment variables from {env_path}")
+    load_dotenv(ENV_PATH)
+    logger.info(f"Loaded environment variables from {ENV_PATH}")
     
     # Get YouTube API key and channel ID from environment variables
     youtube_api_key = os.environ.get('YOUTUBE_API_KEY')
@@ -40,6 +42,7 @@ def main():
     logger.info(f"Using YouTube channel ID: {youtube_channel_id}")
     
     # Get subscriber count
+    from youtube_utils import get_youtube_subscriber_count
     try:
         subscriber_count = get_youtube_subscriber_count(youtube_api_key, youtube_channel_id)
         
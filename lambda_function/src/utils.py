@@ -1,771 +1,200 @@
-import json
-import logging
+import gzip
+import orjson
+import re
+import zlib
+from functools import lru_cache
 from datetime import datetime, timedelta
-from jinja2 import Template
-import pytz
-
-# Configure logging
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+from pathlib import Path
+from zoneinfo import ZoneInfo
+from botocore.config import Config
+
+PACIFIC_TZ = ZoneInfo('America/Los_Angeles')
+
+# Subtitles under the ratio, depending on whether commits outnumber followers
+RATIO_SUBTITLE_BUILDING = "Focusing more on building than on social media presence!"
+RATIO_SUBTITLE_NEEDS_WORK = "I need to build more..."
+
+# Most daily entries embedded for the chart; longer histories are thinned to fit
+MAX_CHART_POINTS = 200
+
+# English month names for the last-updated stamp, independent of the process locale
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+# Shared by every boto3 client: keep connections alive across warm invocations,
+# fail fast on a stalled connection and back off adaptively on throttling
+boto_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=20,
+    connect_timeout=2,
+    read_timeout=10,
+    retries={'mode': 'adaptive', 'max_attempts': 5}
+)
+
+# Source of the Commits or Clout page, written with {{ name }} placeholders and read once per container
+HTML_TEMPLATE_SOURCE = (Path(__file__).resolve().parent / 'template.html').read_text(encoding='utf-8')
 
 def get_html_template():
     """
     Returns the HTML template for the Commits or Clout website
     """
-    return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Commits or Clout</title>
-    <!-- Favicon links -->
-    <link rel="icon" href="/favicon.ico" sizes="any">
-    <link rel="icon" href="/favicon.svg" type="image/svg+xml">
-    <link rel="apple-touch-icon" href="/apple-touch-icon.png">
-    <link rel="icon" type="image/png" sizes="96x96" href="/favicon-96x96.png">
-    <link rel="manifest" href="/site.webmanifest">
-    <!-- Add Chart.js -->
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <!-- Plausible Analytics -->
-    <script defer data-domain="commits.willness.dev" src="https://plausible-analytics-ce-production-d9c9.up.railway.app/js/script.js"></script>
-    <style>
-        :root {
-            --bg-color: #0d1117;
-            --card-bg: #161b22;
-            --text-primary: #f0f6fc;
-            --text-secondary: #8b949e;
-            --accent-github: #238636;
-            --accent-twitter: #1d9bf0;
-            --border-color: #30363d;
-        }
-
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        html {
-            overflow-x: hidden; /* Prevent horizontal scrolling */
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
-            background-color: var(--bg-color);
-            color: var(--text-primary);
-            line-height: 1.6;
-            padding: 20px;
-            position: relative;
-            overflow-x: hidden;
-        }
-
-        /* Animated gradient background */
-        body::before {
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: 
-                radial-gradient(
-                    circle at 20% 30%, 
-                    rgba(35, 134, 54, 0.03) 0%, 
-                    transparent 50%
-                ),
-                radial-gradient(
-                    circle at 80% 70%, 
-                    rgba(29, 155, 240, 0.03) 0%, 
-                    transparent 50%
-                );
-            z-index: -2;
-            animation: gradientShift 15s ease infinite alternate;
-        }
-
-        @keyframes gradientShift {
-            0% {
-                background-position: 0% 0%;
-            }
-            100% {
-                background-position: 100% 100%;
-            }
-        }
-
-        .container {
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 40px 20px;
-        }
-
-        header {
-            text-align: center;
-            margin-bottom: 40px;
-            position: relative;
-        }
-
-        /* Particles around logo */
-        .particles-container {
-            position: absolute;
-            top: -80px;
-            right: -80px;
-            width: 160px;
-            height: 160px;
-            z-index: -1;
-            pointer-events: none;
-        }
-
-        .particle {
-            position: absolute;
-            width: 4px;
-            height: 4px;
-            border-radius: 50%;
-            background-color: var(--accent-github);
-            opacity: 0;
-            animation: particle-animation 3s ease-in-out infinite;
-        }
-
-        .particle:nth-child(even) {
-            background-color: var(--accent-twitter);
-        }
-
-        .particle:nth-child(1) { top: 20%; left: 30%; animation-delay: 0s; }
-        .particle:nth-child(2) { top: 70%; left: 60%; animation-delay: 0.3s; }
-        .particle:nth-child(3) { top: 40%; left: 80%; animation-delay: 0.6s; }
-        .particle:nth-child(4) { top: 60%; left: 20%; animation-delay: 0.9s; }
-        .particle:nth-child(5) { top: 30%; left: 50%; animation-delay: 1.2s; }
-        .particle:nth-child(6) { top: 80%; left: 40%; animation-delay: 1.5s; }
-        .particle:nth-child(7) { top: 50%; left: 70%; animation-delay: 1.8s; }
-        .particle:nth-child(8) { top: 10%; left: 60%; animation-delay: 2.1s; }
-
-        @keyframes particle-animation {
-            0% {
-                transform: scale(0) translate(0, 0);
-                opacity: 0;
-            }
-            50% {
-                opacity: 0.8;
-                transform: scale(1) translate(10px, 10px);
-            }
-            100% {
-                transform: scale(0) translate(20px, 20px);
-                opacity: 0;
-            }
-        }
-
-        /* Floating logo animation */
-        .floating-logo {
-            position: absolute;
-            top: -60px;
-            right: -60px;
-            width: 120px;
-            height: 120px;
-            opacity: 0.7;
-            animation: float 6s ease-in-out infinite;
-            z-index: -1;
-            pointer-events: none; /* Prevent interaction with the logo */
-            transform-origin: center; /* Ensure rotation happens from center */
-        }
-
-        .floating-logo img {
-            width: 100%;
-            height: 100%;
-            filter: drop-shadow(0 0 10px rgba(255, 255, 255, 0.2));
-            animation: rotate 20s linear infinite;
-        }
-
-        @keyframes float {
-            0% {
-                transform: translateY(0px);
-            }
-            50% {
-                transform: translateY(-15px);
-            }
-            100% {
-                transform: translateY(0px);
-            }
-        }
-
-        @keyframes rotate {
-            0% {
-                transform: rotate(0deg);
-            }
-            100% {
-                transform: rotate(360deg);
-            }
-        }
-
-        /* Glowing effect for the logo */
-        .logo-glow {
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: radial-gradient(
-                circle at center,
-                rgba(35, 134, 54, 0.3) 0%,
-                rgba(29, 155, 240, 0.3) 50%,
-                transparent 70%
-            );
-            filter: blur(15px);
-            opacity: 0.5;
-            animation: pulse 4s ease-in-out infinite alternate;
-        }
-
-        @keyframes pulse {
-            0% {
-                opacity: 0.3;
-                transform: scale(0.95);
-            }
-            100% {
-                opacity: 0.6;
-                transform: scale(1.05);
-            }
-        }
-
-        h1 {
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            background: linear-gradient(90deg, var(--accent-github), var(--accent-twitter));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            position: relative;
-            z-index: 1;
-        }
-
-        .subtitle {
-            color: var(--text-secondary);
-            font-size: 1.2rem;
-        }
+    return HTML_TEMPLATE_SOURCE
+
+# Indentation, trailing spaces and blank lines; newlines themselves are kept so that
+# inline JS keeps its statement boundaries
+_WHITESPACE_RUN_PATTERN = re.compile(r"[ \t]*\n\s*")
+_HTML_COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.S)
+# Comments are only stripped inside inline <style> and <script> blocks, where their syntax applies
+_STYLE_BLOCK_PATTERN = re.compile(r"(<style>)(.*?)(</style>)", re.S)
+_CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+_SCRIPT_BLOCK_PATTERN = re.compile(r"(<script>)(.*?)(</script>)", re.S)
+# Whole-line // comments and ones trailing a statement's semicolon, so // inside strings is left alone
+_JS_LINE_COMMENT_PATTERN = re.compile(r"^[ \t]*//[^\n]*$|(?<=;)[ \t]+//[^\n]*$", re.M)
+
+def minify_html(source):
+    """
+    Strip comments, indentation, trailing whitespace and blank lines from HTML source
 
-        .stats-container {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 20px;
-            margin-bottom: 40px;
-        }
+    Args:
+        source (str): HTML source
 
-        .stat-card {
-            flex: 1;
-            min-width: 250px;
-            background-color: var(--card-bg);
-            border-radius: 10px;
-            padding: 25px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            border: 1px solid var(--border-color);
-            transition: transform 0.3s ease;
-        }
+    Returns:
+        str: The source without HTML, CSS or JS comments, and with every whitespace
+        run that contains a newline reduced to one newline
+    """
+    source = _HTML_COMMENT_PATTERN.sub("", source)
+    source = _STYLE_BLOCK_PATTERN.sub(lambda match: match.group(1) + _CSS_COMMENT_PATTERN.sub("", match.group(2)) + match.group(3), source)
+    source = _SCRIPT_BLOCK_PATTERN.sub(lambda match: match.group(1) + _JS_LINE_COMMENT_PATTERN.sub("", match.group(2)) + match.group(3), source)
+    return _WHITESPACE_RUN_PATTERN.sub("\n", source)
 
-        .stat-card:hover {
-            transform: translateY(-5px);
-        }
+# The page's only conditional: the Bluesky footer link, which is rendered into its own slot
+_BLUESKY_BLOCK_PATTERN = re.compile(r"\{% if bluesky_username %\}(.*?)\{% endif %\}", re.S)
+# A {{ name }} or {{ name|safe }} placeholder
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*(\w+)(?:\|safe)?\s*\}\}")
 
-        .github-card {
-            border-top: 4px solid var(--accent-github);
-        }
+def split_template(source):
+    """
+    Split template source with {{ name }} placeholders into UTF-8 encoded
+    literal segments and the slot names that go between them
 
-        .twitter-card {
-            border-top: 4px solid #aaaaaa;
-        }
+    Args:
+        source (str): Template source
 
-        .total-card {
-            border-top: 4px solid #1d9bf0;
-        }
+    Returns:
+        tuple: (segments, slots), where len(segments) == len(slots) + 1
+    """
+    parts = _PLACEHOLDER_PATTERN.split(source)
+    segments = tuple(part.encode('utf-8') for part in parts[0::2])
+    slots = tuple(parts[1::2])
+    return segments, slots
 
-        .stat-title {
-            display: flex;
-            align-items: center;
-            margin-bottom: 15px;
-            font-size: 1.2rem;
-            color: var(--text-secondary);
-        }
+def fill_template(template, values):
+    """
+    Fill a template produced by split_template
 
-        .stat-title svg {
-            margin-right: 10px;
-        }
+    Args:
+        template (tuple): (segments, slots) from split_template
+        values (dict): Value for each slot; bytes are inserted as-is, anything else via str()
 
-        .stat-value {
-            font-size: 3rem;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }
+    Returns:
+        bytes: The filled-in template
+    """
+    segments, slots = template
+    parts = [segments[0]]
+    for slot, segment in zip(slots, segments[1:]):
+        parts.append(_encode_value(values[slot]))
+        parts.append(segment)
+    return b"".join(parts)
 
-        .github-card .stat-value {
-            color: var(--accent-github);
-        }
+def _encode_value(value):
+    return value if isinstance(value, bytes) else str(value).encode('utf-8')
 
-        .twitter-card .stat-value {
-            color: #aaaaaa;
-        }
+def precompress_prefix(template, level=6):
+    """
+    Gzip-compress the literal prefix of a template produced by split_template
 
-        .total-card .stat-value {
-            color: #1d9bf0;
-        }
+    Args:
+        template (tuple): (segments, slots) from split_template
+        level (int, optional): zlib compression level
 
-        .stat-description {
-            color: var(--text-secondary);
-            font-size: 0.9rem;
-        }
+    Returns:
+        tuple: (compressed bytes emitted so far, compressor positioned after the prefix)
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(template[0][0]), compressor
 
-        .comparison-card {
-            background-color: var(--card-bg);
-            border-radius: 10px;
-            padding: 25px;
-            margin-bottom: 40px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            border: 1px solid var(--border-color);
-            text-align: center;
-        }
+def fill_template_gzip(template, precompressed, values):
+    """
+    Fill a template produced by split_template straight into a gzip stream
 
-        .ratio {
-            font-size: 2.5rem;
-            font-weight: bold;
-            margin: 20px 0;
-            background: linear-gradient(90deg, var(--accent-github), var(--accent-twitter));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
+    Compression resumes from a copy of the compressor state left after the
+    prefix, so the prefix is never recompressed and the output is the same as
+    gzip-compressing fill_template() in one go.
 
-        /* Chart container styles */
-        .chart-container {
-            background-color: var(--card-bg);
-            border-radius: 10px;
-            padding: 25px;
-            margin-bottom: 40px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            border: 1px solid var(--border-color);
-        }
+    Args:
+        template (tuple): (segments, slots) from split_template
+        precompressed (tuple): precompress_prefix() of the same template
+        values (dict): Value for each slot, as for fill_template
 
-        .chart-title {
-            text-align: center;
-            margin-bottom: 20px;
-            font-size: 1.5rem;
-        }
+    Returns:
+        bytes: gzip-encoded filled-in template
+    """
+    segments, slots = template
+    head, compressor = precompressed
+    parts = []
+    for slot, segment in zip(slots, segments[1:]):
+        parts.append(_encode_value(values[slot]))
+        parts.append(segment)
+    compressor = compressor.copy()
+    return head + compressor.compress(b"".join(parts)) + compressor.flush()
+
+# Minify and split the page template once per container so warm invocations only fill it in
+_html_source = minify_html(HTML_TEMPLATE_SOURCE)
+_bluesky_block = _BLUESKY_BLOCK_PATTERN.search(_html_source)
+_BLUESKY_FOOTER_TEMPLATE = split_template(_bluesky_block.group(1))
+_HTML_TEMPLATE = split_template(
+    _html_source[:_bluesky_block.start()] + "{{ bluesky_footer_link }}" + _html_source[_bluesky_block.end():]
+)
+# The head of the page (styles and scripts up to the first value) never changes, so compress it once
+_HTML_TEMPLATE_GZIP_PREFIX = precompress_prefix(_HTML_TEMPLATE)
+
+def load_json_body(response):
+    """
+    Parse the JSON body of an S3 get_object response, decompressing it first
+    if the object was stored with Content-Encoding: gzip
 
-        .footer {
-            text-align: center;
-            margin-top: 40px;
-            color: var(--text-secondary);
-            font-size: 0.9rem;
-        }
+    Args:
+        response (dict): Response returned by s3.get_object
 
-        .footer a {
-            color: var(--text-primary);
-            text-decoration: none;
-        }
+    Returns:
+        The decoded JSON document
+    """
+    body = response['Body'].read()
+    if response.get('ContentEncoding') == 'gzip':
+        body = gzip.decompress(body)
+    return orjson.loads(body)
 
-        .footer a:hover {
-            text-decoration: underline;
-        }
-        
-        .social-links {
-            display: flex;
-            justify-content: center;
-            gap: 20px;
-            margin-top: 10px;
-        }
-        
-        .social-links a {
-            display: flex;
-            align-items: center;
-        }
-        
-        .social-links svg {
-            margin-right: 5px;
-        }
+def get_latest_version_id(s3_client, bucket, key):
+    """
+    Return the version ID of the most recent stored version of an S3 object,
+    skipping delete markers. Returns None if the object has no versions.
 
-        .last-updated {
-            margin-top: 10px;
-            font-size: 0.8rem;
-            color: var(--text-secondary);
-        }
+    Args:
+        s3_client: boto3 S3 client
+        bucket (str): Bucket name
+        key (str): Object key
 
-        @media (max-width: 600px) {
-            .stats-container {
-                flex-direction: column;
-            }
-            
-            h1 {
-                font-size: 2rem;
-            }
-            
-            .stat-value {
-                font-size: 2.5rem;
-            }
-            
-            /* Hide chart container on mobile screens */
-            .chart-container {
-                display: none;
-            }
-            
-            /* Make social links display in a column on mobile */
-            .social-links {
-                flex-direction: column;
-                align-items: center;
-                gap: 10px;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <!-- Particles around logo -->
-            <div class="particles-container">
-                <div class="particle"></div>
-                <div class="particle"></div>
-                <div class="particle"></div>
-                <div class="particle"></div>
-                <div class="particle"></div>
-                <div class="particle"></div>
-                <div class="particle"></div>
-                <div class="particle"></div>
-            </div>
-            
-            <!-- Floating animated logo -->
-            <div class="floating-logo">
-                <div class="logo-glow"></div>
-                <img src="/favicon.svg" alt="Commits or Clout Logo">
-            </div>
-            
-            <h1>Commits or Clout</h1>
-            <p class="subtitle">Tracking my GitHub activity vs. social media following</p>
-        </header>
-
-        <div class="stats-container">
-            <div class="stat-card github-card">
-                <div class="stat-title">
-                    <a href="https://github.com/{{ github_username }}" target="_blank" style="color: inherit; text-decoration: none; display: flex; align-items: center;">
-                        <svg height="24" width="24" viewBox="0 0 16 16" fill="currentColor">
-                            <path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"></path>
-                        </svg>
-                        GitHub Commits
-                    </a>
-                </div>
-                <a href="https://github.com/{{ github_username }}" target="_blank" style="text-decoration: none;">
-                    <div class="stat-value">{{ github_commits }}</div>
-                </a>
-                <div class="stat-description">Total commits since January 1st</div>
-            </div>
-
-            <div class="stat-card total-card">
-                <div class="stat-title">
-                    <a href="https://willness.dev?tab=socials" target="_blank" style="color: inherit; text-decoration: none; display: flex; align-items: center;">
-                        <svg height="24" width="24" viewBox="0 0 24 24" fill="currentColor">
-                            <path d="M17.9,17.39C17.64,16.59 16.89,16 16,16H15V13A1,1 0 0,0 14,12H8V10H10A1,1 0 0,0 11,9V7H13A2,2 0 0,0 15,5V4.59C17.93,5.77 20,8.64 20,12C20,14.19 19.2,15.8 17.9,17.39M11,19.93C7.05,19.44 4,16.08 4,12C4,11.38 4.08,10.78 4.21,10.21L9,15V16A2,2 0 0,0 11,18M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2Z" />
-                        </svg>
-                        Total Followers
-                    </a>
-                </div>
-                <a href="https://willness.dev?tab=socials" target="_blank" style="text-decoration: none;">
-                    <div class="stat-value">{{ total_followers }}</div>
-                </a>
-                <div class="stat-description">Combined social media followers</div>
-            </div>
-        </div>
-
-        <div class="comparison-card">
-            <h2>Commits vs. Clout</h2>
-            <div class="ratio">{{ ratio_text }}</div>
-            <p>{{ ratio_text_subtitle }}</p>
-        </div>
-
-        <!-- Chart container -->
-        <div class="chart-container">
-            <h2 class="chart-title">Historical Data</h2>
-            <canvas id="historyChart"></canvas>
-        </div>
-
-        <!-- Today's Stats -->
-        <div class="chart-container">
-            <h2 class="chart-title">Today's Activity</h2>
-            <div class="stats-container" style="margin-bottom: 0;">
-                <div class="stat-card github-card">
-                    <div class="stat-title">
-                        <a href="https://github.com/{{ github_username }}" target="_blank" style="color: inherit; text-decoration: none; display: flex; align-items: center;">
-                            <svg height="24" width="24" viewBox="0 0 16 16" fill="currentColor">
-                                <path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"></path>
-                            </svg>
-                            Today's Commits
-                        </a>
-                    </div>
-                    <a href="https://github.com/{{ github_username }}" target="_blank" style="text-decoration: none;">
-                        <div class="stat-value">{{ commits_today }}</div>
-                    </a>
-                    <div class="stat-description">Commits made today</div>
-                </div>
-
-                <div class="stat-card total-card">
-                    <div class="stat-title">
-                        <a href="https://willness.dev?tab=socials" target="_blank" style="color: inherit; text-decoration: none; display: flex; align-items: center;">
-                            <svg height="24" width="24" viewBox="0 0 24 24" fill="currentColor">
-                                <path d="M17.9,17.39C17.64,16.59 16.89,16 16,16H15V13A1,1 0 0,0 14,12H8V10H10A1,1 0 0,0 11,9V7H13A2,2 0 0,0 15,5V4.59C17.93,5.77 20,8.64 20,12C20,14.19 19.2,15.8 17.9,17.39M11,19.93C7.05,19.44 4,16.08 4,12C4,11.38 4.08,10.78 4.21,10.21L9,15V16A2,2 0 0,0 11,18M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2Z" />
-                            </svg>
-                            Today's Followers
-                        </a>
-                    </div>
-                    <a href="https://willness.dev?tab=socials" target="_blank" style="text-decoration: none;">
-                        <div class="stat-value">{{ followers_today }}</div>
-                    </a>
-                    <div class="stat-description">Followers gained today</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Weekly Activity -->
-        <div class="chart-container">
-            <h2 class="chart-title">This Week's Activity</h2>
-            <div class="stats-container" style="margin-bottom: 0;">
-                <div class="stat-card github-card">
-                    <div class="stat-title">
-                        <a href="https://github.com/{{ github_username }}" target="_blank" style="color: inherit; text-decoration: none; display: flex; align-items: center;">
-                            <svg height="24" width="24" viewBox="0 0 16 16" fill="currentColor">
-                                <path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"></path>
-                            </svg>
-                            Week's Commits
-                        </a>
-                    </div>
-                    <a href="https://github.com/{{ github_username }}" target="_blank" style="text-decoration: none;">
-                        <div class="stat-value">{{ commits_week }}</div>
-                    </a>
-                    <div class="stat-description">Commits made in the last 7 days</div>
-                </div>
-
-                <div class="stat-card total-card">
-                    <div class="stat-title">
-                        <a href="https://willness.dev?tab=socials" target="_blank" style="color: inherit; text-decoration: none; display: flex; align-items: center;">
-                            <svg height="24" width="24" viewBox="0 0 24 24" fill="currentColor">
-                                <path d="M17.9,17.39C17.64,16.59 16.89,16 16,16H15V13A1,1 0 0,0 14,12H8V10H10A1,1 0 0,0 11,9V7H13A2,2 0 0,0 15,5V4.59C17.93,5.77 20,8.64 20,12C20,14.19 19.2,15.8 17.9,17.39M11,19.93C7.05,19.44 4,16.08 4,12C4,11.38 4.08,10.78 4.21,10.21L9,15V16A2,2 0 0,0 11,18M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2Z" />
-                            </svg>
-                            Week's Followers
-                        </a>
-                    </div>
-                    <a href="https://willness.dev?tab=socials" target="_blank" style="text-decoration: none;">
-                        <div class="stat-value">{{ followers_week }}</div>
-                    </a>
-                    <div class="stat-description">Followers gained in the last 7 days</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Social Media Breakdown -->
-        <div class="stats-container">
-            <div class="stat-card twitter-card">
-                <div class="stat-title">
-                    <a href="https://twitter.com/{{ twitter_username }}" target="_blank" style="color: inherit; text-decoration: none; display: flex; align-items: center;">
-                        <svg height="24" width="24" viewBox="0 0 24 24" fill="currentColor">
-                            <path d="M18.244 2.25h3.308l-7.227 8.26 8.502 11.24H16.17l-5.214-6.817L4.99 21.75H1.68l7.73-8.835L1.254 2.25H8.08l4.713 6.231zm-1.161 17.52h1.833L7.084 4.126H5.117z"></path>
-                        </svg>
-                        X/Twitter Followers
-                    </a>
-                </div>
-                <a href="https://twitter.com/{{ twitter_username }}" target="_blank" style="text-decoration: none;">
-                    <div class="stat-value">{{ twitter_followers }}</div>
-                </a>
-                <div class="stat-description">Current X/Twitter follower count</div>
-            </div>
-
-            <div class="stat-card" style="border-top: 4px solid #FF0000;">
-                <div class="stat-title">
-                    <a href="https://www.youtube.com/channel/{{ youtube_channel_id }}" target="_blank" style="color: inherit; text-decoration: none; display: flex; align-items: center;">
-                        <svg height="24" width="24" viewBox="0 0 24 24" fill="currentColor">
-                            <path d="M10,15L15.19,12L10,9V15M21.56,7.17C21.69,7.64 21.78,8.27 21.84,9.07C21.91,9.87 21.94,10.56 21.94,11.16L22,12C22,14.19 21.84,15.8 21.56,16.83C21.31,17.73 20.73,18.31 19.83,18.56C19.36,18.69 18.5,18.78 17.18,18.84C15.88,18.91 14.69,18.94 13.59,18.94L12,19C7.81,19 5.2,18.84 4.17,18.56C3.27,18.31 2.69,17.73 2.44,16.83C2.31,16.36 2.22,15.73 2.16,14.93C2.09,14.13 2.06,13.44 2.06,12.84L2,12C2,9.81 2.16,8.2 2.44,7.17C2.69,6.27 3.27,5.69 4.17,5.44C4.64,5.31 5.5,5.22 6.82,5.16C8.12,5.09 9.31,5.06 10.41,5.06L12,5C16.19,5 18.8,5.16 19.83,5.44C20.73,5.69 21.31,6.27 21.56,7.17Z" />
-                        </svg>
-                        YouTube Subscribers
-                    </a>
-                </div>
-                <a href="https://www.youtube.com/channel/{{ youtube_channel_id }}" target="_blank" style="text-decoration: none;">
-                    <div class="stat-value" style="color: #FF0000;">{{ youtube_subscribers }}</div>
-                </a>
-                <div class="stat-description">Current YouTube subscriber count</div>
-            </div>
-            
-            <div class="stat-card" style="border-top: 4px solid #0085ff;">
-                <div class="stat-title">
-                    <a href="https://bsky.app/profile/{{ bluesky_username }}" target="_blank" style="color: inherit; text-decoration: none; display: flex; align-items: center;">
-                        <svg height="24" width="24" viewBox="0 0 600 530" fill="currentColor">
-                            <path d="m135.72 44.03c66.496 49.921 138.02 151.14 164.28 205.46 26.262-54.316 97.782-155.54 164.28-205.46 47.98-36.021 125.72-63.892 125.72 24.795 0 17.712-10.155 148.79-16.111 170.07-20.703 73.984-96.144 92.854-163.25 81.433 117.3 19.964 147.14 86.092 82.697 152.22-122.39 125.59-175.91-31.511-189.63-71.766-2.514-7.3797-3.6904-10.832-3.7077-7.8964-0.0174-2.9357-1.1937 0.51669-3.7077 7.8964-13.714 40.255-67.233 197.36-189.63 71.766-64.444-66.128-34.605-132.26 82.697-152.22-67.108 11.421-142.55-7.4491-163.25-81.433-5.9562-21.282-16.111-152.36-16.111-170.07 0-88.687 77.742-60.816 125.72-24.795z" />
-                        </svg>
-                        Bluesky Followers
-                    </a>
-                </div>
-                <a href="https://bsky.app/profile/{{ bluesky_username }}" target="_blank" style="text-decoration: none;">
-                    <div class="stat-value" style="color: #0085ff;">{{ bluesky_followers }}</div>
-                </a>
-                <div class="stat-description">Current Bluesky follower count</div>
-            </div>
-        </div>
-
-        <div class="footer">
-            <p>Created with ❤️ by <a href="https://willness.dev" target="_blank">willness.dev</a></p>
-            <div class="social-links">
-                <a href="https://github.com/{{ github_username }}" target="_blank">
-                    <svg height="16" width="16" viewBox="0 0 16 16" fill="currentColor">
-                        <path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"></path>
-                    </svg>
-                    @{{ github_username }}
-                </a>
-                <a href="https://twitter.com/{{ twitter_username }}" target="_blank">
-                    <svg height="16" width="16" viewBox="0 0 24 24" fill="currentColor">
-                        <path d="M18.244 2.25h3.308l-7.227 8.26 8.502 11.24H16.17l-5.214-6.817L4.99 21.75H1.68l7.73-8.835L1.254 2.25H8.08l4.713 6.231zm-1.161 17.52h1.833L7.084 4.126H5.117z"></path>
-                    </svg>
-                    @{{ twitter_username }}
-                </a>
-                {% if bluesky_username %}
-                <a href="https://bsky.app/profile/{{ bluesky_username }}" target="_blank">
-                    <svg height="16" width="16" viewBox="0 0 600 530" fill="currentColor">
-                        <path d="m135.72 44.03c66.496 49.921 138.02 151.14 164.28 205.46 26.262-54.316 97.782-155.54 164.28-205.46 47.98-36.021 125.72-63.892 125.72 24.795 0 17.712-10.155 148.79-16.111 170.07-20.703 73.984-96.144 92.854-163.25 81.433 117.3 19.964 147.14 86.092 82.697 152.22-122.39 125.59-175.91-31.511-189.63-71.766-2.514-7.3797-3.6904-10.832-3.7077-7.8964-0.0174-2.9357-1.1937 0.51669-3.7077 7.8964-13.714 40.255-67.233 197.36-189.63 71.766-64.444-66.128-34.605-132.26 82.697-152.22-67.108 11.421-142.55-7.4491-163.25-81.433-5.9562-21.282-16.111-152.36-16.111-170.07 0-88.687 77.742-60.816 125.72-24.795z" />
-                    </svg>
-                    @{{ bluesky_username }}
-                </a>
-                {% endif %}
-            </div>
-            <p class="last-updated">Last updated: <span id="last-updated">{{ last_updated }}</span></p>
-        </div>
-    </div>
-
-    <!-- Chart.js initialization script -->
-    <script>
-        // Parse the historical data from the template
-        const historicalData = {{ historical_data_json|safe }};
-        
-        // Extract dates and values for the chart
-        const dates = historicalData.data.map(entry => entry.date);
-        const commits = historicalData.data.map(entry => entry.github_commits);
-        const followers = historicalData.data.map(entry => entry.twitter_followers);
-        const youtubeSubscribers = historicalData.data.map(entry => entry.youtube_subscribers || 0);
-        const blueskyFollowers = historicalData.data.map(entry => entry.bluesky_followers || 0);
-        const totalFollowers = historicalData.data.map(entry => entry.total_followers || entry.twitter_followers);
-        
-        // Function to determine point radius based on dataset size
-        const getPointRadius = (dataLength) => {
-            if (dataLength > 100) return 0;  // Hide points for large datasets
-            if (dataLength > 60) return 1;   // Very small points for medium-large datasets
-            return 2;                        // Default size for smaller datasets
-        };
-        
-        // Set point radius based on dataset size
-        const pointRadius = getPointRadius(dates.length);
-        
-        // Create the chart
-        const ctx = document.getElementById('historyChart').getContext('2d');
-        const chart = new Chart(ctx, {
-            type: 'line',
-            data: {
-                labels: dates,
-                datasets: [
-                    {
-                        label: 'GitHub Commits',
-                        data: commits,
-                        borderColor: '#238636',
-                        backgroundColor: 'rgba(35, 134, 54, 0.1)',
-                        borderWidth: 2,
-                        tension: 0.1,
-                        pointBackgroundColor: '#238636',
-                        pointRadius: pointRadius,
-                        pointHoverRadius: 4
-                    },
-                    {
-                        label: 'Total Followers',
-                        data: totalFollowers,
-                        borderColor: '#1d9bf0',
-                        backgroundColor: 'rgba(29, 155, 240, 0.1)',
-                        borderWidth: 2,
-                        tension: 0.1,
-                        pointBackgroundColor: '#1d9bf0',
-                        pointRadius: pointRadius,
-                        pointHoverRadius: 4
-                    },
-                    {
-                        label: 'X/Twitter Followers',
-                        data: followers,
-                        borderColor: '#aaaaaa',
-                        backgroundColor: 'rgba(170, 170, 170, 0.1)',
-                        borderWidth: 2,
-                        tension: 0.1,
-                        pointBackgroundColor: '#aaaaaa',
-                        pointRadius: pointRadius,
-                        pointHoverRadius: 4
-                    },
-                    {
-                        label: 'YouTube Subscribers',
-                        data: youtubeSubscribers,
-                        borderColor: '#FF0000',
-                        backgroundColor: 'rgba(255, 0, 0, 0.1)',
-                        borderWidth: 2,
-                        tension: 0.1,
-                        pointBackgroundColor: '#FF0000',
-                        pointRadius: pointRadius,
-                        pointHoverRadius: 4
-                    },
-                    {
-                        label: 'Bluesky Followers',
-                        data: blueskyFollowers,
-                        borderColor: '#0085ff',
-                        backgroundColor: 'rgba(0, 133, 255, 0.1)',
-                        borderWidth: 2,
-                        tension: 0.1,
-                        pointBackgroundColor: '#0085ff',
-                        pointRadius: pointRadius,
-                        pointHoverRadius: 4
-                    }
-                ]
-            },
-            options: {
-                responsive: true,
-                maintainAspectRatio: true,
-                elements: {
-                    point: {
-                        radius: 2,
-                        hoverRadius: 4,
-                        hitRadius: 6
-                    },
-                    line: {
-                        borderWidth: 2
-                    }
-                },
-                plugins: {
-                    legend: {
-                        position: 'top',
-                        labels: {
-                            color: '#f0f6fc'
-                        }
-                    },
-                    tooltip: {
-                        mode: 'index',
-                        intersect: false
-                    },
-                    decimation: {
-                        enabled: true,
-                        algorithm: 'min-max'
-                    }
-                },
-                scales: {
-                    x: {
-                        ticks: {
-                            color: '#8b949e'
-                        },
-                        grid: {
-                            color: 'rgba(48, 54, 61, 0.5)'
-                        }
-                    },
-                    y: {
-                        ticks: {
-                            color: '#8b949e'
-                        },
-                        grid: {
-                            color: 'rgba(48, 54, 61, 0.5)'
-                        },
-                        beginAtZero: true
-                    }
-                }
-            }
-        });
-    </script>
-</body>
-</html>"""
+    Returns:
+        str: Version ID, or None
+    """
+    response = s3_client.list_object_versions(Bucket=bucket, Prefix=key)
+    versions = [v for v in response.get('Versions', []) if v['Key'] == key]
+    if not versions:
+        return None
+    latest = max(versions, key=lambda v: v['LastModified'])
+    return latest['VersionId']
 
 def calculate_weekly_activity(historical_data):
     """
@@ -796,10 +225,10 @@ def calculate_weekly_activity(historical_data):
     if data:
         current_entry = data[-1]
     
-    # Find the entry closest to 7 days ago
+    # Find the entry closest to 7 days ago; ISO dates order the same as strings, so no parsing is needed
+    week_ago_iso = week_ago.isoformat()
     for entry in reversed(data):
-        entry_date = datetime.strptime(entry["date"], "%Y-%m-%d").date()
-        if entry_date <= week_ago:
+        if entry["date"] <= week_ago_iso:
             week_ago_entry = entry
             break
     
@@ -822,7 +251,144 @@ def calculate_weekly_activity(historical_data):
         "followers_week": max(0, followers_week)  # Ensure non-negative
     }
 
-def render_html_template(commit_count, follower_count, github_username, twitter_username, historical_data=None, youtube_channel_id=None, bluesky_username=None, commits_today=0, followers_today=0, commits_week=None, followers_week=None):
+# The values the chart plots for an entry, with the same fallbacks as the chart script
+_CHART_METRICS = (
+    lambda entry: entry["github_commits"],
+    lambda entry: entry["twitter_followers"],
+    lambda entry: entry.get("youtube_subscribers") or 0,
+    lambda entry: entry.get("bluesky_followers") or 0,
+    lambda entry: entry.get("total_followers") or entry["twitter_followers"]
+)
+
+def _decimation_indices(columns, entry_count, window_count):
+    """
+    Indices kept by min/max decimation of the metric columns over window_count equal windows
+    """
+    keep = {0, entry_count - 1}
+    for window in range(window_count):
+        start = window * entry_count // window_count
+        end = (window + 1) * entry_count // window_count
+        for column in columns:
+            window_values = column[start:end]
+            keep.add(start + window_values.index(min(window_values)))
+            keep.add(start + window_values.index(max(window_values)))
+    return keep
+
+def downsample_history(entries, max_points=MAX_CHART_POINTS):
+    """
+    Thin daily entries for the chart to at most max_points with min/max decimation
+
+    The entries are cut into equal windows, and each window keeps the entries
+    holding the minimum and maximum of every plotted metric. Kept entries are
+    whole days, so dates and tooltip values stay exact; for the mostly monotonic
+    counts this is usually just the first and last day of each window. The first
+    and last entries are always kept. A window can keep up to two entries per
+    metric, so the number of windows is the largest (found by binary search)
+    whose result still fits in max_points.
+
+    Args:
+        entries (list): Daily entries, oldest first
+        max_points (int, optional): Most entries to return; shorter lists are returned as-is
+
+    Returns:
+        list: The kept entries in their original order
+    """
+    entry_count = len(entries)
+    if entry_count <= max_points:
+        return entries
+
+    columns = [[metric(entry) for entry in entries] for metric in _CHART_METRICS]
+    keep = _decimation_indices(columns, entry_count, 1)
+    low, high = 2, max_points // 2
+    while low <= high:
+        window_count = (low + high) // 2
+        candidate = _decimation_indices(columns, entry_count, window_count)
+        if len(candidate) <= max_points:
+            keep, low = candidate, window_count + 1
+        else:
+            high = window_count - 1
+    return [entries[index] for index in sorted(keep)]
+
+def chart_history_json(historical_data):
+    """
+    Serialize the historical entries for the page's chart
+
+    Long histories are thinned with downsample_history(), and only the fields
+    the chart script reads are kept; the stored ratio and last_updated
+    timestamp of every entry would otherwise add about 40% to the embedded
+    payload. Optional counts missing from older entries are emitted as null,
+    which the script already falls back from.
+
+    Args:
+        historical_data (dict): Historical data with a "data" list of daily entries
+
+    Returns:
+        bytes: JSON object with a "data" list, ready to embed in the page
+    """
+    return orjson.dumps({"data": [
+        {
+            "date": entry["date"],
+            "github_commits": entry["github_commits"],
+            "twitter_followers": entry["twitter_followers"],
+            "youtube_subscribers": entry.get("youtube_subscribers"),
+            "bluesky_followers": entry.get("bluesky_followers"),
+            "total_followers": entry.get("total_followers")
+        }
+        for entry in downsample_history(historical_data["data"])
+    ]})
+
+def format_last_updated(moment):
+    """
+    Format a timestamp as e.g. "March 05, 2025 at 02:30 PM PST"
+
+    Same output as strftime("%B %d, %Y at %I:%M %p %Z") in the C locale, built
+    from a fixed month table instead of strftime's locale lookups.
+
+    Args:
+        moment (datetime): Timezone-aware timestamp
+
+    Returns:
+        str: The formatted timestamp
+    """
+    hour = moment.hour
+    meridiem = "PM" if hour >= 12 else "AM"
+    return f"{MONTH_NAMES[moment.month - 1]} {moment.day:02d}, {moment.year} at {hour % 12 or 12:02d}:{moment.minute:02d} {meridiem} {moment.tzname()}"
+
+def calculate_ratio_tenths(commit_count, total_followers):
+    """
+    Calculate the commits-to-followers ratio in tenths, rounded half up
+
+    Integer arithmetic keeps the page, the stored history and the backfill in
+    agreement; float round() rounds halves to even (1/4 would give 0.2).
+
+    Args:
+        commit_count (int): Number of GitHub commits
+        total_followers (int): Followers across all platforms
+
+    Returns:
+        int: floor(10 * commits / followers + 1/2), or 10 when there are no followers
+    """
+    if total_followers <= 0:
+        return 10
+    return (commit_count * 20 + total_followers) // (total_followers * 2)
+
+@lru_cache(maxsize=256)
+def ratio_texts(ratio_tenths, year):
+    """
+    Build the ratio headline and subtitle, encoded for the page template
+
+    Args:
+        ratio_tenths (int): Commits-to-followers ratio in tenths
+        year (int): Year the commits are counted for
+
+    Returns:
+        tuple: (ratio_text, ratio_text_subtitle) as UTF-8 bytes
+    """
+    ratio_text = f"I have {ratio_tenths / 10}x as many commits in {year} as followers"
+    ratio_text_subtitle = RATIO_SUBTITLE_BUILDING if ratio_tenths > 10 else RATIO_SUBTITLE_NEEDS_WORK
+    return ratio_text.encode('utf-8'), ratio_text_subtitle.encode('utf-8')
+
+def render_html_template(commit_count, follower_count, github_username, twitter_username, historical_data=None, youtube_channel_id=None, bluesky_username=None, commits_today=0, followers_today=0, commits_week=None, followers_week=None, gzip_encoded=False):
     """
     Render the HTML template with the provided data
     
@@ -838,9 +404,10 @@ def render_html_template(commit_count, follower_count, github_username, twitter_
         followers_today (int, optional): Number of followers gained today
         commits_week (int, optional): Number of commits made in the last 7 days
         followers_week (int, optional): Number of followers gained in the last 7 days
+        gzip_encoded (bool, optional): Return the page gzip-encoded, resuming from the pre-compressed page head
         
     Returns:
-        str: Rendered HTML content
+        bytes: Rendered HTML content, UTF-8 encoded (gzip-compressed if gzip_encoded)
     """
     # Calculate weekly activity if not provided
     if commits_week is None or followers_week is None:
@@ -853,55 +420,54 @@ def render_html_template(commit_count, follower_count, github_username, twitter_
     bluesky_followers = 0
     total_followers = follower_count
     
-    if historical_data and "data" in historical_data and historical_data["data"]:
-        latest_entry = historical_data["data"][-1]
+    entries = historical_data.get("data") if historical_data else None
+    if entries:
+        latest_entry = entries[-1]
         youtube_subscribers = latest_entry.get("youtube_subscribers", 0)
         bluesky_followers = latest_entry.get("bluesky_followers", 0)
         total_followers = latest_entry.get("total_followers", follower_count)
     
-    # Calculate ratio based on total followers
-    ratio = round((commit_count / total_followers if total_followers > 0 else 1) * 10) / 10
-    current_year = datetime.now().year
-    ratio_text = f"I have {ratio}x as many commits in {current_year} as followers"
+    # Calculate ratio based on total followers, in tenths
+    ratio_tenths = calculate_ratio_tenths(commit_count, total_followers)
 
-    # Generate the ratio text subtitle
-    ratio_text_subtitle = "Focusing more on building than on social media presence!" if ratio > 1 else "I need to build more..."
+    # Take the year and the timestamp from the same Pacific time reading
+    current_datetime = datetime.now(PACIFIC_TZ)
+    ratio_text, ratio_text_subtitle = ratio_texts(ratio_tenths, current_datetime.year)
     
-    # Format the current date with time in PST timezone
-    pacific_tz = pytz.timezone('America/Los_Angeles')
-    current_datetime = datetime.now(pacific_tz)
-    timezone_name = "PDT" if current_datetime.dst() else "PST"
-    current_date = current_datetime.strftime("%B %d, %Y at %I:%M %p") + f" {timezone_name}"
+    # Format the current date with time in Pacific time
+    current_date = format_last_updated(current_datetime)
     
     # If no historical data is provided, create a minimal structure
     if historical_data is None:
         historical_data = {"data": []}
     
-    # Convert historical data to JSON for the template
-    historical_data_json = json.dumps(historical_data)
+    # Convert historical data to JSON for the template; the bytes go straight into the page
+    historical_data_json = chart_history_json(historical_data)
     
-    # Create a Jinja2 template from the HTML string
-    template = Template(get_html_template())
-
-    # Render the template with the data
-    html_content = template.render(
-        github_commits=commit_count,
-        twitter_followers=follower_count,
-        youtube_subscribers=youtube_subscribers,
-        bluesky_followers=bluesky_followers,
-        total_followers=total_followers,
-        ratio_text=ratio_text,
-        ratio_text_subtitle=ratio_text_subtitle,
-        github_username=github_username,
-        twitter_username=twitter_username,
-        youtube_channel_id=youtube_channel_id or "",
-        bluesky_username=bluesky_username or "",
-        last_updated=current_date,
-        historical_data_json=historical_data_json,
-        commits_today=commits_today,
-        followers_today=followers_today,
-        commits_week=commits_week,
-        followers_week=followers_week
-    )
-    
-    return html_content 
\ No newline at end of file
+    # Only link to Bluesky in the footer when a username is configured
+    bluesky_footer_link = fill_template(_BLUESKY_FOOTER_TEMPLATE, {"bluesky_username": bluesky_username}) if bluesky_username else b""
+
+    # Fill in the pre-split template with the data
+    values = {
+        "github_commits": commit_count,
+        "twitter_followers": follower_count,
+        "youtube_subscribers": youtube_subscribers,
+        "bluesky_followers": bluesky_followers,
+        "total_followers": total_followers,
+        "ratio_text": ratio_text,
+        "ratio_text_subtitle": ratio_text_subtitle,
+        "github_username": github_username,
+        "twitter_username": twitter_username,
+        "youtube_channel_id": youtube_channel_id or "",
+        "bluesky_username": bluesky_username or "",
+        "bluesky_footer_link": bluesky_footer_link,
+        "last_updated": current_date,
+        "historical_data_json": historical_data_json,
+        "commits_today": commits_today,
+        "followers_today": followers_today,
+        "commits_week": commits_week,
+        "followers_week": followers_week
+    }
+    if gzip_encoded:
+        return fill_template_gzip(_HTML_TEMPLATE, _HTML_TEMPLATE_GZIP_PREFIX, values)
+    return fill_template(_HTML_TEMPLATE, values) 
\ No newline at end of file
@@ -1,9 +1,30 @@
 import requests
 import logging
+import orjson
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Configure logging
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# Level and handlers come from the entrypoint (the Lambda handler or a local script)
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeout for YouTube Data API requests, in seconds
+YOUTUBE_TIMEOUT_SECONDS = (3, 10)
+
+# How long a fetched subscriber count is reused. YouTube only reports counts rounded to three
+# significant figures, so with the 30-minute schedule every other run can skip the API call
+YOUTUBE_CACHE_TTL_SECONDS = 3600
+
+# (api_key, channel_id) -> (monotonic time fetched, subscriber count); failures are never cached
+subscriber_count_cache = {}
+
+# Session kept for the life of the container so warm invocations reuse the googleapis.com connection
+youtube_session = requests.Session()
+youtube_session.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=2,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
 
 def get_youtube_subscriber_count(api_key, channel_id):
     """
@@ -20,21 +41,30 @@ def get_youtube_subscriber_count(api_key, channel_id):
         logger.warning("YouTube API key or channel ID not provided")
         return None
         
+    cache_key = (api_key, channel_id)
+    cached = subscriber_count_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < YOUTUBE_CACHE_TTL_SECONDS:
+        logger.info(f"Using cached YouTube subscriber count: {cached[1]}")
+        return cached[1]
+
     url = "https://www.googleapis.com/youtube/v3/channels"
     params = {
         "part": "statistics",
         "id": channel_id,
-        "key": api_key
+        "key": api_key,
+        # Only the subscriber count is read, so have the API return just that
+        "fields": "items/statistics/subscriberCount"
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = youtube_session.get(url, params=params, timeout=YOUTUBE_TIMEOUT_SECONDS)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         if "items" in data and len(data["items"]) > 0:
             subscriber_count = int(data["items"][0]["statistics"]["subscriberCount"])
             logger.info(f"Found {subscriber_count} YouTube subscribers")
+            subscriber_count_cache[cache_key] = (time.monotonic(), subscriber_count)
             return subscriber_count
         else:
             error_msg = f"No channel data found for channel ID: {channel_id}"
@@ -0,0 +1,136 @@
+// Draws the history chart on the Commits or Clout page.
+// The page defines the chart data inline as window.historicalData before loading this script.
+const entries = window.historicalData.data;
+
+// Extract dates and values for the chart
+const dates = entries.map(entry => entry.date);
+const commits = entries.map(entry => entry.github_commits);
+const followers = entries.map(entry => entry.twitter_followers);
+const youtubeSubscribers = entries.map(entry => entry.youtube_subscribers || 0);
+const blueskyFollowers = entries.map(entry => entry.bluesky_followers || 0);
+const totalFollowers = entries.map(entry => entry.total_followers || entry.twitter_followers);
+
+// Function to determine point radius based on dataset size
+const getPointRadius = (dataLength) => {
+    if (dataLength > 100) return 0;  // Hide points for large datasets
+    if (dataLength > 60) return 1;   // Very small points for medium-large datasets
+    return 2;                        // Default size for smaller datasets
+};
+
+// Set point radius based on dataset size
+const pointRadius = getPointRadius(dates.length);
+
+// Create the chart
+const ctx = document.getElementById('historyChart').getContext('2d');
+const chart = new Chart(ctx, {
+    type: 'line',
+    data: {
+        labels: dates,
+        datasets: [
+            {
+                label: 'GitHub Commits',
+                data: commits,
+                borderColor: '#238636',
+                backgroundColor: 'rgba(35, 134, 54, 0.1)',
+                borderWidth: 2,
+                tension: 0.1,
+                pointBackgroundColor: '#238636',
+                pointRadius: pointRadius,
+                pointHoverRadius: 4
+            },
+            {
+                label: 'Total Followers',
+                data: totalFollowers,
+                borderColor: '#1d9bf0',
+                backgroundColor: 'rgba(29, 155, 240, 0.1)',
+                borderWidth: 2,
+                tension: 0.1,
+                pointBackgroundColor: '#1d9bf0',
+                pointRadius: pointRadius,
+                pointHoverRadius: 4
+            },
+            {
+                label: 'X/Twitter Followers',
+                data: followers,
+                borderColor: '#aaaaaa',
+                backgroundColor: 'rgba(170, 170, 170, 0.1)',
+                borderWidth: 2,
+                tension: 0.1,
+                pointBackgroundColor: '#aaaaaa',
+                pointRadius: pointRadius,
+                pointHoverRadius: 4
+            },
+            {
+                label: 'YouTube Subscribers',
+                data: youtubeSubscribers,
+                borderColor: '#FF0000',
+                backgroundColor: 'rgba(255, 0, 0, 0.1)',
+                borderWidth: 2,
+                tension: 0.1,
+                pointBackgroundColor: '#FF0000',
+                pointRadius: pointRadius,
+                pointHoverRadius: 4
+            },
+            {
+                label: 'Bluesky Followers',
+                data: blueskyFollowers,
+                borderColor: '#0085ff',
+                backgroundColor: 'rgba(0, 133, 255, 0.1)',
+                borderWidth: 2,
+                tension: 0.1,
+                pointBackgroundColor: '#0085ff',
+                pointRadius: pointRadius,
+                pointHoverRadius: 4
+            }
+        ]
+    },
+    options: {
+        responsive: true,
+        maintainAspectRatio: true,
+        elements: {
+            point: {
+                radius: 2,
+                hoverRadius: 4,
+                hitRadius: 6
+            },
+            line: {
+                borderWidth: 2
+            }
+        },
+        plugins: {
+            legend: {
+                position: 'top',
+                labels: {
+                    color: '#f0f6fc'
+                }
+            },
+            tooltip: {
+                mode: 'index',
+                intersect: false
+            },
+            decimation: {
+                enabled: true,
+                algorithm: 'min-max'
+            }
+        },
+        scales: {
+            x: {
+                ticks: {
+                    color: '#8b949e'
+                },
+                grid: {
+                    color: 'rgba(48, 54, 61, 0.5)'
+                }
+            },
+            y: {
+                ticks: {
+                    color: '#8b949e'
+                },
+                grid: {
+                    color: 'rgba(48, 54, 61, 0.5)'
+                },
+                beginAtZero: true
+            }
+        }
+    }
+});
@@ -6,13 +6,12 @@ This script is for local analysis only and should not be deployed.
 
 import os
 import sys
-import json
-import boto3
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import gzip
+import orjson
 from datetime import datetime, date
 from dotenv import load_dotenv
 import logging
+from operator import itemgetter
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +20,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Only open a window when there is a display to show it on; otherwise render
+# straight to PNG with Agg and skip the GUI backend import entirely. macOS and
+# Windows always have one, Linux only under X11 or Wayland
+SHOW_PLOT = not sys.platform.startswith('linux') or bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+# 120 DPI at 12x8 inches is 1440x960, plenty for a followers chart
+PLOT_DPI = 120
+
 def load_environment():
     """Load environment variables from .env file"""
     # Look for .env file in lambda_function directory
@@ -47,19 +54,30 @@ def load_environment():
     
     return {
         'bucket': os.environ.get('S3_BUCKET'),
-        'history_key': os.environ.get('S3_HISTORY_KEY', 'historical_data.json'),
-        'backup_key': os.environ.get('S3_HISTORY_BACKUP_KEY', 'historical_data_backup.json')
+        'history_key': os.environ.get('S3_HISTORY_KEY', 'historical_data.json')
     }
 
+def load_json_body(response):
+    """Parse an S3 JSON object body, decompressing it if stored gzip-encoded"""
+    body = response['Body'].read()
+    if response.get('ContentEncoding') == 'gzip':
+        body = gzip.decompress(body)
+    return orjson.loads(body)
+
 def fetch_historical_data_from_s3(config):
     """Fetch historical data from S3"""
+    # Imported here so startup and the .env checks don't pay for boto3
+    import boto3
+    from botocore.config import Config
+
     try:
         # Initialize S3 client with credentials from environment
         s3 = boto3.client(
             's3',
             aws_access_key_id=os.environ.get('AWS_ACCESS_KEY_ID'),
             aws_secret_access_key=os.environ.get('AWS_SECRET_ACCESS_KEY'),
-            region_name=os.environ.get('AWS_REGION', 'us-east-1')
+            region_name=os.environ.get('AWS_REGION', 'us-east-1'),
+            config=Config(tcp_keepalive=True, retries={'mode': 'adaptive', 'max_attempts': 5})
         )
         
         logger.info(f"Fetching historical data from S3: {config['bucket']}/{config['history_key']}")
@@ -67,17 +85,22 @@ def fetch_historical_data_from_s3(config):
         try:
             # Try to get the main historical data file
             response = s3.get_object(Bucket=config['bucket'], Key=config['history_key'])
-            historical_data = json.loads(response['Body'].read().decode('utf-8'))
+            historical_data = load_json_body(response)
             logger.info("Successfully retrieved historical data from S3")
             return historical_data
             
         except s3.exceptions.NoSuchKey:
-            logger.info("Main historical data not found, trying backup...")
+            logger.info("Main historical data not found, trying the most recent previous version...")
             
-            # Try to get the backup file
-            response = s3.get_object(Bucket=config['bucket'], Key=config['backup_key'])
-            historical_data = json.loads(response['Body'].read().decode('utf-8'))
-            logger.info("Successfully retrieved historical data from backup")
+            # The bucket is versioned, so a deleted file is still available as a noncurrent version
+            response = s3.list_object_versions(Bucket=config['bucket'], Prefix=config['history_key'])
+            versions = [v for v in response.get('Versions', []) if v['Key'] == config['history_key']]
+            if not versions:
+                raise Exception("No previous version of historical data found")
+            latest = max(versions, key=lambda v: v['LastModified'])
+            response = s3.get_object(Bucket=config['bucket'], Key=config['history_key'], VersionId=latest['VersionId'])
+            historical_data = load_json_body(response)
+            logger.info(f"Successfully retrieved historical data from version {latest['VersionId']}")
             return historical_data
             
     except Exception as e:
@@ -87,32 +110,33 @@ def fetch_historical_data_from_s3(config):
 def filter_current_year_data(historical_data):
     """Filter data to only include current year"""
     current_year = datetime.now().year
-    filtered_data = []
-    
-    for entry in historical_data.get('data', []):
-        entry_date = datetime.strptime(entry['date'], '%Y-%m-%d')
-        if entry_date.year == current_year:
-            filtered_data.append(entry)
+    # Entry dates are ISO YYYY-MM-DD strings, so the year is their prefix
+    year_prefix = f"{current_year}-"
+    filtered_data = [entry for entry in historical_data.get('data', []) if entry['date'].startswith(year_prefix)]
     
     logger.info(f"Filtered to {len(filtered_data)} entries for year {current_year}")
     return filtered_data
 
-def create_twitter_followers_plot(data):
-    """Create and display a plot of Twitter followers over time"""
+def create_twitter_followers_plot(data, dpi=PLOT_DPI, show=True):
+    """Create a plot of Twitter followers over time, save it as a PNG and optionally display it"""
     if not data:
         logger.error("No data available for plotting")
         return
-    
-    # Extract dates and Twitter follower counts
-    dates = []
-    twitter_followers = []
-    
-    for entry in data:
-        dates.append(datetime.strptime(entry['date'], '%Y-%m-%d').date())
-        twitter_followers.append(entry.get('twitter_followers', 0))
+
+    # numpy and matplotlib are only needed once there is data to plot
+    import numpy as np
+    import matplotlib
+    if not SHOW_PLOT:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    
+    # Extract dates and Twitter follower counts as arrays; numpy parses the ISO dates in C
+    dates = np.array(list(map(itemgetter('date'), data)), dtype='datetime64[D]')
+    twitter_followers = np.fromiter((entry.get('twitter_followers', 0) for entry in data), dtype=np.int64, count=len(data))
     
     # Create the plot
-    plt.figure(figsize=(12, 8))
+    fig = plt.figure(figsize=(12, 8))
     plt.plot(dates, twitter_followers, marker='o', linewidth=2, markersize=4, color='#1d9bf0')
     
     # Customize the plot
@@ -127,12 +151,12 @@ def create_twitter_followers_plot(data):
     plt.xticks(rotation=45)
     
     # Add some statistics to the plot
-    min_followers = min(twitter_followers)
-    max_followers = max(twitter_followers)
-    current_followers = twitter_followers[-1] if twitter_followers else 0
+    min_followers = twitter_followers.min()
+    max_followers = twitter_followers.max()
+    current_followers = twitter_followers[-1]
     
     # Add text box with statistics
-    stats_text = f'Current: {current_followers}\nMin: {min_followers}\nMax: {max_followers}\nGrowth: +{current_followers - twitter_followers[0] if twitter_followers else 0}'
+    stats_text = f'Current: {current_followers}\nMin: {min_followers}\nMax: {max_followers}\nGrowth: +{current_followers - twitter_followers[0]}'
     plt.text(0.02, 0.98, stats_text, transform=plt.gca().transAxes, 
              verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
     
@@ -141,11 +165,13 @@ def create_twitter_followers_plot(data):
     
     # Save the plot
     output_file = os.path.join(os.path.dirname(__file__), f'twitter_followers_{datetime.now().year}.png')
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=dpi, bbox_inches='tight')
     logger.info(f"Plot saved to: {output_file}")
     
     # Display the plot
-    plt.show()
+    if show and SHOW_PLOT:
+        plt.show()
+    plt.close(fig)
     
     return output_file
 